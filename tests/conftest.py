@@ -21,6 +21,11 @@ os.environ["MONGO_PORT"] = "27017"
 os.environ["MONGO_DB"] = "test_db"
 # Use memory storage for Flask-Limiter in tests
 os.environ["RATELIMIT_STORAGE_URI"] = "memory://"
+# Cheapest Argon2 cost for password hashes created by the app in tests
+os.environ["ARGON2_TIME_COST"] = "1"
+os.environ["ARGON2_MEMORY_COST"] = "8"
+# Keep checking list responses against their schemas in tests
+os.environ["VALIDATE_API_RESPONSE"] = "true"
 
 # Create mock database and patch before importing app
 _mock_client = MongoClient()
@@ -2,6 +2,7 @@
 
 import pytest
 from datetime import datetime, timedelta, timezone
+import bcrypt
 import jwt
 from web.security import JWT_SECRET_KEY, JWT_ALGORITHM
 
@@ -236,3 +237,383 @@ class TestAuthentication:
         assert response.status_code == 200
         data = response.get_json()
         assert data["is_admin"] is False
+
+
+@pytest.mark.auth
+class TestCredentialsCache:
+    """Test caching of successful password verifications."""
+
+    @pytest.fixture
+    def cached_user(self):
+        """Insert an active user into the security module's database and clear the cache."""
+        from web import security
+
+        security._VERIFIED_CREDENTIALS.clear()
+        password_hash = security.hash_password("secret123")
+        security.db["users"].insert_one({"username": "cacheuser", "password_hash": password_hash, "is_active": True})
+        yield security
+        security.db["users"].delete_many({"username": "cacheuser"})
+        security._VERIFIED_CREDENTIALS.clear()
+
+    def test_successful_check_is_cached(self, cached_user):
+        """A repeated successful login skips hash verification."""
+        from unittest.mock import patch
+
+        with patch("web.security.PASSWORD_HASHER", wraps=cached_user.PASSWORD_HASHER) as hasher:
+            assert cached_user.verify_user_credentials("cacheuser", "secret123") is True
+            assert cached_user.verify_user_credentials("cacheuser", "secret123") is True
+
+        assert hasher.verify.call_count == 1
+
+    def test_failed_check_is_not_cached(self, cached_user):
+        """Wrong passwords are verified every time."""
+        from unittest.mock import patch
+
+        with patch("web.security.PASSWORD_HASHER", wraps=cached_user.PASSWORD_HASHER) as hasher:
+            assert cached_user.verify_user_credentials("cacheuser", "wrong") is False
+            assert cached_user.verify_user_credentials("cacheuser", "wrong") is False
+
+        assert hasher.verify.call_count == 2
+        assert len(cached_user._VERIFIED_CREDENTIALS) == 0
+
+    def test_password_change_invalidates_cache(self, cached_user):
+        """A cached password stops working once the stored hash changes."""
+        assert cached_user.verify_user_credentials("cacheuser", "secret123") is True
+
+        new_hash = cached_user.hash_password("newsecret")
+        cached_user.db["users"].update_one({"username": "cacheuser"}, {"$set": {"password_hash": new_hash}})
+
+        assert cached_user.verify_user_credentials("cacheuser", "secret123") is False
+        assert cached_user.verify_user_credentials("cacheuser", "newsecret") is True
+
+
+@pytest.mark.auth
+class TestAdminFallback:
+    """Tests for the ADMIN_PASSWORD_HASH fallback when the admin is not in the database."""
+
+    def test_admin_fallback(self):
+        """The configured admin can log in without a users document; other names cannot."""
+        from unittest.mock import patch
+
+        from mongomock import MongoClient
+
+        from web import security
+
+        with patch.object(security, "db", MongoClient()["fallback_db"]):
+            assert security.verify_user_credentials("admin", "admin123") is True
+            assert security.verify_user_credentials("admin", "wrong") is False
+            assert security.verify_user_credentials("admin2", "admin123") is False
+
+
+@pytest.mark.auth
+class TestPasswordHashMigration:
+    """Test Argon2id hashing and upgrade of legacy bcrypt hashes on login."""
+
+    @pytest.fixture
+    def legacy_user(self):
+        """Insert an active user whose password is stored as a bcrypt hash."""
+        from web import security
+
+        security._VERIFIED_CREDENTIALS.clear()
+        password_hash = bcrypt.hashpw(b"legacy123", bcrypt.gensalt(rounds=4)).decode()
+        security.db["users"].insert_one({"username": "legacyuser", "password_hash": password_hash, "is_active": True})
+        yield security
+        security.db["users"].delete_many({"username": "legacyuser"})
+        security._VERIFIED_CREDENTIALS.clear()
+
+    def test_hash_password_uses_argon2id(self):
+        """New hashes are Argon2id PHC strings."""
+        from web import security
+
+        password_hash = security.hash_password("secret123")
+
+        assert password_hash.startswith("$argon2id$")
+        assert security.password_needs_rehash(password_hash) is False
+
+    def test_legacy_hash_is_upgraded_on_login(self, legacy_user):
+        """A successful login with a bcrypt hash stores an Argon2id hash instead."""
+        assert legacy_user.verify_user_credentials("legacyuser", "legacy123") is True
+
+        stored = legacy_user.db["users"].find_one({"username": "legacyuser"})["password_hash"]
+        assert stored.startswith("$argon2id$")
+        assert legacy_user.verify_user_credentials("legacyuser", "legacy123") is True
+
+    def test_failed_legacy_login_keeps_hash(self, legacy_user):
+        """A wrong password leaves the bcrypt hash in place."""
+        assert legacy_user.verify_user_credentials("legacyuser", "wrong") is False
+
+        stored = legacy_user.db["users"].find_one({"username": "legacyuser"})["password_hash"]
+        assert stored.startswith("$2b$")
+
+
+@pytest.mark.auth
+class TestTokenCache:
+    """Test caching of decoded JWT payloads in verify_token."""
+
+    def test_valid_token_is_decoded_once(self):
+        """Repeated verification of the same token reuses the cached payload."""
+        from unittest.mock import patch
+
+        from web import security
+
+        token = security.create_access_token("cached_token_user")
+        with patch("web.security.jwt.decode", wraps=jwt.decode) as decode:
+            first = security.verify_token(token, "access")
+            second = security.verify_token(token, "access")
+
+        assert first["username"] == "cached_token_user"
+        assert second == first
+        assert decode.call_count == 1
+
+    def test_cache_keys_are_short_digests(self):
+        """Cached tokens are keyed by a 16-byte digest, not the token itself."""
+        from web import security
+
+        security._VERIFIED_TOKENS.clear()
+        token = security.create_access_token("digest_user")
+        assert security.verify_token(token, "access") is not None
+
+        assert list(security._VERIFIED_TOKENS) == [security._cache_key(b"access", token.encode())]
+        assert len(security._cache_key(b"access", token.encode())) == 16
+
+    def test_wrong_type_and_invalid_tokens_not_cached(self):
+        """Tokens that fail verification are not stored."""
+        from web import security
+
+        token = security.create_access_token("cached_token_user2")
+
+        assert security.verify_token(token, "refresh") is None
+        assert security._cache_key(b"refresh", token.encode()) not in security._VERIFIED_TOKENS
+        assert security.verify_token("not-a-token", "access") is None
+        assert security._cache_key(b"access", b"not-a-token") not in security._VERIFIED_TOKENS
+
+    def test_cached_entry_expires_with_token(self):
+        """A token close to expiry is cached no longer than its remaining lifetime."""
+        import time
+
+        from web import security
+
+        payload = {"username": "short", "exp": int(time.time()) + 5, "type": "access"}
+        assert security._token_ttu(None, payload, 100.0) <= 105.0
+        payload["exp"] = int(time.time()) + 3600
+        assert security._token_ttu(None, payload, 100.0) == 160.0
+
+
+@pytest.mark.auth
+class TestRefreshTokenTouch:
+    """Test that try_refresh_access_token throttles last_used_at writes."""
+
+    def _refresh(self, security, token):
+        from web.app import app
+
+        with app.test_request_context("/", headers={"Cookie": f"refresh_token={token}"}):
+            return security.try_refresh_access_token()
+
+    def test_last_used_at_written_once_per_interval(self):
+        """The first refresh records last_used_at; an immediate second refresh does not rewrite it."""
+        from unittest.mock import patch
+
+        from web import security
+
+        token = jwt.encode(
+            {"username": "touch_user", "exp": datetime.now(timezone.utc) + timedelta(days=1), "type": "refresh"},
+            JWT_SECRET_KEY,
+            algorithm=JWT_ALGORITHM,
+        )
+        security.db["refresh_tokens"].insert_one({"token": token, "username": "touch_user"})
+        try:
+            assert self._refresh(security, token) is not None
+            first = security.db["refresh_tokens"].find_one({"token": token})["last_used_at"]
+
+            with patch.object(security.db["refresh_tokens"], "update_one") as update_one:
+                assert self._refresh(security, token) is not None
+            update_one.assert_not_called()
+            assert first is not None
+        finally:
+            security.db["refresh_tokens"].delete_many({"token": token})
+
+    def test_stale_last_used_at_is_updated(self):
+        """A refresh after the interval updates last_used_at."""
+        from web import security
+
+        token = jwt.encode(
+            {"username": "touch_user2", "exp": datetime.now(timezone.utc) + timedelta(days=1), "type": "refresh"},
+            JWT_SECRET_KEY,
+            algorithm=JWT_ALGORITHM,
+        )
+        stale = datetime.now(timezone.utc) - timedelta(hours=1)
+        security.db["refresh_tokens"].insert_one({"token": token, "username": "touch_user2", "last_used_at": stale})
+        try:
+            assert self._refresh(security, token) is not None
+            last_used_at = security.db["refresh_tokens"].find_one({"token": token})["last_used_at"]
+            assert last_used_at.replace(tzinfo=timezone.utc) > stale
+        finally:
+            security.db["refresh_tokens"].delete_many({"token": token})
+
+
+@pytest.mark.auth
+class TestPasswordHashPool:
+    """Tests for password hashing on the shared pool."""
+
+    def test_submit_password_hash_runs_on_pool(self):
+        """The hash is produced on a pool thread and verifies against the password."""
+        import threading
+
+        from web import security
+
+        future = security.PASSWORD_HASH_POOL.submit(lambda: threading.current_thread().name)
+        assert future.result(timeout=security.PASSWORD_HASH_TIMEOUT).startswith("pwhash")
+
+        password_hash = security.submit_password_hash("pool_password").result(timeout=security.PASSWORD_HASH_TIMEOUT)
+        assert isinstance(password_hash, str)
+        assert security.PASSWORD_HASHER.verify(password_hash, "pool_password")
+
+
+@pytest.mark.auth
+class TestEnsureIndexes:
+    """Tests for startup index creation."""
+
+    def test_user_indexes_created(self):
+        """Usernames are unique and the user list sort is indexed."""
+        from web import security
+
+        security.ensure_indexes()
+        indexes = security.db["users"].index_information()
+
+        assert any(info["key"] == [("username", 1)] and info.get("unique") for info in indexes.values())
+        assert any(info["key"] == [("created_at", -1)] for info in indexes.values())
+
+    def test_create_indexes_command(self):
+        """Indexes are created by the create-indexes CLI command rather than on import."""
+        from unittest.mock import patch
+
+        from web import security
+        from web.app import app
+
+        with patch.object(security, "ensure_indexes") as ensure_indexes:
+            result = app.test_cli_runner().invoke(args=["create-indexes"])
+
+        assert result.exit_code == 0
+        ensure_indexes.assert_called_once_with()
+
+
+@pytest.mark.auth
+class TestNestedLoginRequired:
+    """Tests for login_required stacked more than once on a handler."""
+
+    def test_inner_login_required_skips_token_check(self, client):
+        """Only the outermost login_required verifies the token."""
+        from unittest.mock import patch
+
+        from web import security
+        from web.app import app
+
+        @security.login_required
+        @security.login_required
+        def handler():
+            return security.get_current_user()[0]
+
+        token = security.create_access_token("nested_user")
+        with app.test_request_context("/", headers={"Authorization": f"Bearer {token}"}):
+            with patch("web.security.verify_token", wraps=security.verify_token) as verify:
+                assert handler() == "nested_user"
+
+        assert verify.call_count == 1
+
+    def test_flag_is_per_request(self, client):
+        """A new request without a token is rejected even after an authenticated one."""
+        from web import security
+        from web.app import app
+
+        @security.login_required
+        def handler():
+            return "ok"
+
+        token = security.create_access_token("nested_user")
+        with app.test_request_context("/", headers={"Authorization": f"Bearer {token}"}):
+            assert handler() == "ok"
+        with app.test_request_context("/"):
+            response, status = handler()
+
+        assert status == 401
+
+
+@pytest.mark.auth
+class TestTokenEncoding:
+    """Tests for the direct HS256 token encoder."""
+
+    def test_matches_pyjwt_output(self):
+        """Tokens for ASCII-only payloads are identical to jwt.encode()."""
+        from web import security
+
+        payload = {"username": "encode_user", "exp": 1893456000, "type": "access"}
+
+        assert security._encode_token(payload) == jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+
+    def test_non_ascii_username_round_trips(self):
+        """Tokens for non-ASCII usernames verify and keep the username intact."""
+        from web import security
+
+        token = security.create_access_token("Иван")
+        payload = security.verify_token(token)
+
+        assert payload is not None
+        assert payload["username"] == "Иван"
+        assert jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])["username"] == "Иван"
+
+    def test_created_tokens_verify(self):
+        """Access tokens decode with PyJWT and keep the expected claims."""
+        from web import security
+
+        token = security.create_access_token("encode_user")
+        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+
+        assert payload["username"] == "encode_user"
+        assert payload["type"] == "access"
+        assert isinstance(payload["exp"], int)
+        assert payload["exp"] - payload["iat"] == security.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+@pytest.mark.auth
+class TestAdminCheck:
+    """Tests that only the configured admin username has admin rights."""
+
+    def test_is_admin_flag_does_not_grant_admin(self, client, mock_db):
+        """A stale is_admin flag in the database does not pass admin_required."""
+        from web import security
+
+        mock_db["users"].insert_one({"username": "old_admin", "is_admin": True, "is_active": True})
+        token = security.create_access_token("old_admin")
+
+        response = client.get("/api/users", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 403
+        assert security.is_admin("admin") is True
+        assert security.is_admin("old_admin") is False
+
+
+@pytest.mark.auth
+class TestGetTokenFromRequest:
+    """Tests for reading the access token from the request."""
+
+    def test_bearer_header_preferred_over_cookie(self):
+        """A Bearer Authorization header wins over the access_token cookie."""
+        from web.app import app
+        from web.security import get_token_from_request
+
+        with app.test_request_context(
+            "/", headers={"Authorization": "Bearer header-token", "Cookie": "access_token=cookie-token"}
+        ):
+            assert get_token_from_request() == "header-token"
+
+    def test_cookie_used_without_bearer_header(self):
+        """Non-Bearer or missing Authorization headers fall back to the cookie."""
+        from web.app import app
+        from web.security import get_token_from_request
+
+        with app.test_request_context(
+            "/", headers={"Authorization": "Basic abc", "Cookie": "access_token=cookie-token"}
+        ):
+            assert get_token_from_request() == "cookie-token"
+        with app.test_request_context("/"):
+            assert get_token_from_request() is None
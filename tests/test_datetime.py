@@ -232,3 +232,139 @@ class TestDateTimeParsing:
         # Invalid time minutes
         with pytest.raises(ValueError):
             parse_datetime("2024-01-15", "14:60")
+
+
+@pytest.mark.datetime
+class TestSchemaDateTimeParsing:
+    """Test fixed-format date/time parsers used by schema validators."""
+
+    @pytest.mark.parametrize("value", ["2024-01-15", "2024-1-5", "2024-02-29", "２０２４-01-15"])
+    def test_parse_ymd_matches_strptime(self, value):
+        """Valid dates parse to the same value as strptime."""
+        from web.schemas import _parse_ymd
+
+        assert _parse_ymd(value) == datetime.strptime(value, "%Y-%m-%d").date()
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "",
+            "24-01-15",
+            "2024/01/15",
+            "2024-13-01",
+            "2023-02-29",
+            "2024-+1-01",
+            "2024-01-15 ",
+            "2024-W03-1",
+            "2024-01-+1",
+        ],
+    )
+    def test_parse_ymd_invalid(self, value):
+        """Invalid dates raise ValueError."""
+        from web.schemas import _parse_ymd
+
+        with pytest.raises(ValueError):
+            _parse_ymd(value)
+
+    @pytest.mark.parametrize("value", ["14:30", "9:00", "00:00", "23:59", "9:5"])
+    def test_validate_time_accepts_strptime_inputs(self, value):
+        """Times accepted by strptime("%H:%M") are valid."""
+        from web.schemas import _validate_time
+
+        datetime.strptime(value, "%H:%M")
+        assert _validate_time(value) == value
+
+    @pytest.mark.parametrize("value", ["1430", "24:00", "14:60", "14:30:00", " 9:00", "１４:30", "14:", ":30"])
+    def test_validate_time_invalid(self, value):
+        """Invalid times raise the format error."""
+        from web.schemas import _validate_time
+
+        with pytest.raises(ValueError, match="Неверный формат времени"):
+            _validate_time(value)
+
+
+@pytest.mark.datetime
+class TestDateBounds:
+    """Test date bounds enforced by schema validators."""
+
+    def test_record_date_bounds(self):
+        """Dates within the allowed window pass and are returned unchanged."""
+        from web.schemas import _validate_record_date
+
+        today = datetime.now().date()
+        for value in (today, today + timedelta(days=1), today - timedelta(days=49 * 365)):
+            date_str = value.strftime("%Y-%m-%d")
+            assert _validate_record_date(date_str) == date_str
+
+    def test_record_date_too_far_in_future(self):
+        """Record dates more than one day ahead are rejected."""
+        from web.schemas import _validate_record_date
+
+        date_str = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+        with pytest.raises(ValueError, match="в будущем"):
+            _validate_record_date(date_str)
+
+    def test_birth_date_future_not_allowed(self):
+        """Any future birth date is rejected."""
+        from web.schemas import _validate_birth_date
+
+        date_str = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        with pytest.raises(ValueError, match="Дата не может быть в будущем"):
+            _validate_birth_date(date_str)
+
+    def test_too_far_in_past(self):
+        """Dates older than 50 years are rejected by both validators."""
+        from web.schemas import _validate_birth_date, _validate_record_date
+
+        date_str = (datetime.now() - timedelta(days=51 * 365)).strftime("%Y-%m-%d")
+        for validator in (_validate_record_date, _validate_birth_date):
+            with pytest.raises(ValueError, match="50 лет в прошлом"):
+                validator(date_str)
+
+
+@pytest.mark.datetime
+class TestSharedDateTimeTypes:
+    """Tests for the DateStr/TimeStr annotated types shared by health record schemas."""
+
+    def test_update_base_accepts_missing_date_and_time(self):
+        """Optional date/time fields skip validation when omitted."""
+        from web.schemas import WeightRecordUpdate
+
+        data = WeightRecordUpdate(weight=4.5)
+        assert data.date is None
+        assert data.time is None
+
+    def test_create_and_update_share_validation(self):
+        """Create and update schemas reject the same invalid time and future date."""
+        from pydantic import ValidationError
+
+        from web.schemas import WeightRecordCreate, WeightRecordUpdate
+
+        future = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+        for model in (WeightRecordCreate, WeightRecordUpdate):
+            with pytest.raises(ValidationError, match="Неверный формат времени"):
+                model(pet_id="507f1f77bcf86cd799439011", date="2024-01-15", time="25:99", weight=4.5)
+            with pytest.raises(ValidationError, match="в будущем"):
+                model(pet_id="507f1f77bcf86cd799439011", date=future, time="10:00", weight=4.5)
+
+    @pytest.mark.parametrize("days,valid", [(0, True), (-49 * 365, True), (1, False), (-51 * 365, False)])
+    def test_birth_date_bounds(self, days, valid):
+        """Birth dates may be today or up to 50 years back, never in the future."""
+        from web.schemas import _validate_birth_date
+
+        date_str = (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
+        if valid:
+            assert _validate_birth_date(date_str) == date_str
+        else:
+            with pytest.raises(ValueError):
+                _validate_birth_date(date_str)
+
+    def test_record_date_error_messages(self):
+        """The record date validator reports the future bound and invalid formats."""
+        from web.schemas import _validate_record_date
+
+        future = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+        with pytest.raises(ValueError, match="Дата не может быть более чем на 1 день в будущем"):
+            _validate_record_date(future)
+        with pytest.raises(ValueError, match="Неверный формат даты"):
+            _validate_record_date("15.01.2024")
@@ -252,3 +252,20 @@ def test_get_ear_cleaning_invalid_page_size(client, mock_db, admin_token, admin_
     )
     assert response.status_code == 422
 
+
+def test_ear_cleaning_blank_cleaning_type_uses_default(client, mock_db, admin_token, admin_pet):
+    """Test that an empty cleaning_type from an unselected form field falls back to the default."""
+    now = datetime.now(timezone.utc)
+    response = client.post(
+        "/api/ear_cleaning",
+        json={
+            "pet_id": str(admin_pet["_id"]),
+            "date": now.strftime("%Y-%m-%d"),
+            "time": now.strftime("%H:%M"),
+            "cleaning_type": "",
+        },
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.status_code == 201
+    assert mock_db["ear_cleaning"].find_one({})["cleaning_type"] == "Салфетка/Марля"
@@ -223,3 +223,40 @@ class TestErrorHandling:
         assert response.status_code == 500
         data = response.get_json()
         assert "error" in data
+
+    def test_json_provider_uses_orjson(self, client, mock_db):
+        """JSON responses are serialized with orjson, keeping non-ASCII text and HTTP dates."""
+        from flask import jsonify
+
+        from web.app import OrjsonProvider, app
+
+        assert isinstance(app.json, OrjsonProvider)
+        with app.test_request_context("/"):
+            response = jsonify({"error": "Неверные данные", "at": datetime(2024, 1, 15, 14, 30, tzinfo=timezone.utc)})
+
+        assert "Неверные данные".encode() in response.data
+        assert response.get_json() == {"error": "Неверные данные", "at": "Mon, 15 Jan 2024 14:30:00 GMT"}
+
+    def test_json_provider_stringifies_non_str_keys(self, client, mock_db):
+        """Integer dict keys are serialized as strings, like the stdlib json module."""
+        from flask import jsonify
+
+        from web.app import app
+
+        with app.test_request_context("/"):
+            response = jsonify({1: "a", "b": 2})
+
+        assert response.get_json() == {"1": "a", "b": 2}
+
+    def test_openapi_spec_served_from_cache(self, client):
+        """The OpenAPI document is serialized once and includes the bearer auth scheme."""
+        from web.app import _openapi_json
+
+        _openapi_json.cache_clear()
+        first = client.get("/apidoc/openapi.json")
+        second = client.get("/apidoc/openapi.json")
+
+        assert first.status_code == 200
+        assert first.data == second.data
+        assert "bearerAuth" in first.get_json()["components"]["securitySchemes"]
+        assert _openapi_json.cache_info().hits == 1
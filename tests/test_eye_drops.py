@@ -233,3 +233,39 @@ def test_eye_drops_require_pet_id(client, admin_token):
     # flask-pydantic-spec may return validation errors in different formats
     # Check for either our error format or flask-pydantic-spec format
     assert "error" in data or (isinstance(data, list) and len(data) > 0)
+
+
+def test_eye_drops_rejects_unknown_drops_type(client, mock_db, admin_token, admin_pet):
+    """Test that drops_type must be one of the form choices."""
+    now = datetime.now(timezone.utc)
+    response = client.post(
+        "/api/eye_drops",
+        json={
+            "pet_id": str(admin_pet["_id"]),
+            "date": now.strftime("%Y-%m-%d"),
+            "time": now.strftime("%H:%M"),
+            "drops_type": "Неизвестные",
+        },
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.status_code == 422
+    assert mock_db["eye_drops"].count_documents({}) == 0
+
+
+def test_eye_drops_blank_drops_type_uses_default(client, mock_db, admin_token, admin_pet):
+    """Test that an empty drops_type from an unselected form field falls back to the default."""
+    now = datetime.now(timezone.utc)
+    response = client.post(
+        "/api/eye_drops",
+        json={
+            "pet_id": str(admin_pet["_id"]),
+            "date": now.strftime("%Y-%m-%d"),
+            "time": now.strftime("%H:%M"),
+            "drops_type": "",
+        },
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.status_code == 201
+    assert mock_db["eye_drops"].find_one({})["drops_type"] == "Обычные"
@@ -71,6 +71,28 @@ class TestHealthTracking:
         data = response.get_json()
         assert "error" in data or isinstance(data, list)
 
+    @pytest.mark.parametrize("pet_id", ["507f1f77bcf86cd79943901g", "507f1f77bcf86cd7994390", "50 7f 1f77bcf86cd7994390"])
+    def test_get_asthma_attacks_malformed_object_id(self, client, regular_user_token, pet_id):
+        """Test that pet_id must be exactly 24 hex characters."""
+        response = client.get(
+            f"/api/asthma?pet_id={pet_id}", headers={"Authorization": f"Bearer {regular_user_token}"}
+        )
+
+        assert response.status_code == 422
+        errors = response.get_json()
+        assert errors[0]["msg"] == "Value error, Неверный формат ObjectId"
+
+    def test_add_asthma_attack_non_string_pet_id(self, client, regular_user_token):
+        """Test that a non-string pet_id fails the str type check before the ObjectId check."""
+        response = client.post(
+            "/api/asthma",
+            json={"pet_id": 123, "date": "2024-01-15", "time": "14:30"},
+            headers={"Authorization": f"Bearer {regular_user_token}"},
+        )
+
+        assert response.status_code == 422
+        assert response.get_json()[0]["msg"] == "Input should be a valid string"
+
     def test_get_asthma_attacks_success(self, client, mock_db, regular_user_token, test_pet):
         """Test getting asthma attacks."""
         # Add some attacks
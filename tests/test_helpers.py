@@ -158,3 +158,31 @@ class TestParseEventDateTimeSafe:
         assert error_response2 is None
         assert isinstance(event_dt1, datetime)
         assert isinstance(event_dt2, datetime)
+
+
+@pytest.mark.unit
+class TestBulkGridfsDelete:
+    """Tests for bulk_gridfs_delete helper."""
+
+    def test_bulk_gridfs_delete_removes_files_and_chunks(self, client, mock_db):
+        """All given files and their chunks are removed, other files are kept."""
+        from bson import ObjectId
+        from web.helpers import bulk_gridfs_delete
+
+        removed_ids = [ObjectId(), ObjectId()]
+        kept_id = ObjectId()
+        for file_id in removed_ids + [kept_id]:
+            mock_db["fs.files"].insert_one({"_id": file_id})
+            mock_db["fs.chunks"].insert_one({"files_id": file_id, "n": 0})
+
+        deleted = bulk_gridfs_delete([str(removed_ids[0]), removed_ids[1], None])
+
+        assert deleted == 2
+        assert mock_db["fs.files"].count_documents({}) == 1
+        assert mock_db["fs.chunks"].count_documents({"files_id": kept_id}) == 1
+
+    def test_bulk_gridfs_delete_empty(self, client, mock_db):
+        """Nothing is deleted when no ids are given."""
+        from web.helpers import bulk_gridfs_delete
+
+        assert bulk_gridfs_delete([]) == 0
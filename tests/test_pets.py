@@ -35,6 +35,42 @@ class TestPetManagement:
         assert len(data["pets"]) == 1
         assert data["pets"][0]["_id"] == str(test_pet["_id"])
 
+    def test_get_pets_serializes_object_ids_and_default_tiles(self, client, mock_db, regular_user_token, test_pet):
+        """Test that known ObjectId fields are returned as strings and default tiles are filled in."""
+        from web.pets import DEFAULT_TILES_SETTINGS
+
+        photo_file_id = ObjectId()
+        mock_db["pets"].update_one(
+            {"_id": test_pet["_id"]},
+            {"$set": {"photo_file_id": photo_file_id, "shared_with": ["friend"]}},
+        )
+
+        response = client.get("/api/pets", headers={"Authorization": f"Bearer {regular_user_token}"})
+
+        assert response.status_code == 200
+        pet = response.get_json()["pets"][0]
+        assert pet["_id"] == str(test_pet["_id"])
+        assert pet["photo_file_id"] == str(photo_file_id)
+        assert pet["photo_url"].endswith(f"?v={str(photo_file_id)[:8]}")
+        assert pet["shared_with"] == ["friend"]
+        assert pet["tiles_settings"] == DEFAULT_TILES_SETTINGS
+
+    def test_get_pets_default_tiles_settings_not_copied(self, client, mock_db, regular_user_token, test_pet):
+        """Test that pets without custom tiles settings skip the recursive ObjectId conversion."""
+        from unittest.mock import patch
+
+        custom_tiles = {"order": ["weight"], "visible": {"weight": False}}
+        mock_db["pets"].insert_one(
+            {"name": "Custom Cat", "owner": "testuser", "shared_with": [], "tiles_settings": custom_tiles}
+        )
+
+        with patch("web.pets.convert_objectid_to_str", side_effect=lambda obj: obj) as convert:
+            response = client.get("/api/pets", headers={"Authorization": f"Bearer {regular_user_token}"})
+
+        assert response.status_code == 200
+        assert len(response.get_json()["pets"]) == 2
+        convert.assert_called_once_with(custom_tiles)
+
     def test_create_pet_success_json(self, client, mock_db, regular_user_token):
         """Test creating a pet with JSON data."""
         response = client.post(
@@ -63,6 +99,28 @@ class TestPetManagement:
         assert data["success"] is True
         assert data["pet"]["name"] == "Form Cat"
 
+    def test_create_pet_with_photo_optimizes_to_webp(self, client, mock_db, regular_user_token):
+        """Test that an uploaded photo is converted to WebP before being stored."""
+        from io import BytesIO
+        from PIL import Image
+        from web.app import fs
+
+        source = BytesIO()
+        Image.new("RGB", (64, 48), (200, 100, 50)).save(source, format="PNG")
+        source.seek(0)
+
+        response = client.post(
+            "/api/pets",
+            data={"name": "Photo Cat", "photo_file": (source, "cat.png")},
+            headers={"Authorization": f"Bearer {regular_user_token}"},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 201
+        _, kwargs = fs.put.call_args
+        assert kwargs["filename"] == "cat.webp"
+        assert kwargs["content_type"] == "image/webp"
+
     def test_create_pet_missing_name(self, client, regular_user_token):
         """Test creating pet without name."""
         response = client.post(
@@ -199,6 +257,22 @@ class TestPetManagement:
         pet = db["pets"].find_one({"_id": test_pet["_id"]})
         assert "shareuser" in pet.get("shared_with", [])
 
+    def test_share_pet_already_shared(self, client, mock_db, regular_user_token, test_pet):
+        """Test sharing pet with a user who already has access."""
+        mock_db["users"].insert_one({"username": "shareuser", "is_active": True})
+        mock_db["pets"].update_one({"_id": test_pet["_id"]}, {"$set": {"shared_with": ["shareuser"]}})
+
+        response = client.post(
+            f"/api/pets/{test_pet['_id']}/share",
+            json={"username": "shareuser"},
+            headers={"Authorization": f"Bearer {regular_user_token}"},
+        )
+
+        assert response.status_code == 422
+        assert response.get_json()["code"] == "validation_error_already_shared"
+        pet = mock_db["pets"].find_one({"_id": test_pet["_id"]})
+        assert pet["shared_with"] == ["shareuser"]
+
     def test_share_pet_not_owner(self, client, mock_db, regular_user_token, admin_pet):
         """Test sharing pet when not owner."""
         response = client.post(
@@ -290,18 +364,19 @@ class TestPetManagement:
 
     def test_get_pet_photo_success(self, client, mock_db, regular_user_token, test_pet):
         """Test successfully getting pet photo."""
+        from io import BytesIO
         from web.app import db, fs
         from bson import ObjectId
-        from unittest.mock import MagicMock, patch
+        from unittest.mock import patch
 
         # Create photo file ID
         photo_file_id = ObjectId()
         db["pets"].update_one({"_id": test_pet["_id"]}, {"$set": {"photo_file_id": str(photo_file_id)}})
 
-        # Mock GridFS file
-        mock_file = MagicMock()
-        mock_file.read.return_value = b"fake_image_data"
+        # Mock GridFS file (file-like object streamed by send_file)
+        mock_file = BytesIO(b"fake_image_data")
         mock_file.content_type = "image/jpeg"
+        mock_file.length = len(b"fake_image_data")
 
         with patch.object(fs, "get", return_value=mock_file):
             response = client.get(
@@ -314,6 +389,159 @@ class TestPetManagement:
         assert "inline" in response.headers.get("Content-Disposition", "")
         assert "max-age=" in response.headers.get("Cache-Control", "")
 
+    def test_get_pet_photo_streams_gridfs_file(self, client, mock_db, regular_user_token, test_pet):
+        """Test that a real GridFS file is served with Content-Length and honours Range requests."""
+        import gridfs
+        import mongomock.gridfs
+        from web.app import db
+        from unittest.mock import patch
+
+        mongomock.gridfs.enable_gridfs_integration()
+        real_fs = gridfs.GridFS(mock_db)
+        photo_data = bytes(range(256)) * 20
+        photo_file_id = real_fs.put(photo_data, content_type="image/jpeg")
+        db["pets"].update_one({"_id": test_pet["_id"]}, {"$set": {"photo_file_id": str(photo_file_id)}})
+
+        headers = {"Authorization": f"Bearer {regular_user_token}"}
+        with patch("web.app.fs", real_fs):
+            response = client.get(f"/api/pets/{test_pet['_id']}/photo", headers=headers)
+            assert response.status_code == 200
+            assert response.content_length == len(photo_data)
+            assert response.data == photo_data
+
+            response = client.get(f"/api/pets/{test_pet['_id']}/photo", headers={**headers, "Range": "bytes=0-9"})
+            assert response.status_code == 206
+            assert response.content_length == 10
+            assert response.data == photo_data[:10]
+
+    def test_get_pet_photo_unsatisfiable_range(self, client, mock_db, regular_user_token, test_pet):
+        """Test that a Range past the end of the GridFS file returns 416 with Content-Range."""
+        import gridfs
+        import mongomock.gridfs
+        from web.app import db
+        from unittest.mock import patch
+
+        mongomock.gridfs.enable_gridfs_integration()
+        real_fs = gridfs.GridFS(mock_db)
+        photo_data = b"x" * 5000
+        photo_file_id = real_fs.put(photo_data, content_type="image/jpeg")
+        db["pets"].update_one({"_id": test_pet["_id"]}, {"$set": {"photo_file_id": str(photo_file_id)}})
+
+        headers = {"Authorization": f"Bearer {regular_user_token}", "Range": "bytes=999999-"}
+        with patch("web.app.fs", real_fs):
+            response = client.get(f"/api/pets/{test_pet['_id']}/photo", headers=headers)
+
+        assert response.status_code == 416
+        assert response.headers["Content-Range"] == f"bytes */{len(photo_data)}"
+
+    def test_get_pet_photo_not_modified(self, client, mock_db, regular_user_token, test_pet):
+        """Test that a matching If-None-Match returns 304 without a body."""
+        from io import BytesIO
+        from web.app import db, fs
+        from bson import ObjectId
+        from unittest.mock import patch
+
+        photo_file_id = ObjectId()
+        db["pets"].update_one({"_id": test_pet["_id"]}, {"$set": {"photo_file_id": str(photo_file_id)}})
+
+        mock_file = BytesIO(b"fake_image_data")
+        mock_file.content_type = "image/jpeg"
+        mock_file.length = len(b"fake_image_data")
+
+        with patch.object(fs, "get", return_value=mock_file):
+            response = client.get(
+                f"/api/pets/{test_pet['_id']}/photo",
+                headers={
+                    "Authorization": f"Bearer {regular_user_token}",
+                    "If-None-Match": f'"{photo_file_id}_None_None"',
+                },
+            )
+
+        assert response.status_code == 304
+        assert response.data == b""
+
+    def test_get_pet_photo_resized(self, client, mock_db, regular_user_token, test_pet):
+        """Test that requesting a smaller size returns a resized WebP image."""
+        from io import BytesIO
+        from PIL import Image
+        from web.app import db, fs
+        from bson import ObjectId
+        from unittest.mock import patch
+
+        photo_file_id = ObjectId()
+        db["pets"].update_one({"_id": test_pet["_id"]}, {"$set": {"photo_file_id": str(photo_file_id)}})
+
+        source = BytesIO()
+        Image.new("RGB", (400, 200), (10, 120, 200)).save(source, format="JPEG")
+        mock_file = BytesIO(source.getvalue())
+        mock_file.content_type = "image/jpeg"
+
+        with patch.object(fs, "get", return_value=mock_file):
+            response = client.get(
+                f"/api/pets/{test_pet['_id']}/photo?w=100",
+                headers={"Authorization": f"Bearer {regular_user_token}"},
+            )
+
+        assert response.status_code == 200
+        assert response.content_type == "image/webp"
+        with Image.open(BytesIO(response.data)) as img:
+            assert img.size == (100, 50)
+
+    def test_get_pet_photo_resized_from_large_source(self, client, mock_db, regular_user_token, test_pet):
+        """Test that a large source is reduced before resampling and keeps the requested size."""
+        from io import BytesIO
+        from PIL import Image
+        from web.app import db, fs
+        from bson import ObjectId
+        from unittest.mock import patch
+
+        photo_file_id = ObjectId()
+        db["pets"].update_one({"_id": test_pet["_id"]}, {"$set": {"photo_file_id": str(photo_file_id)}})
+
+        source = BytesIO()
+        Image.new("RGB", (2000, 1600), (10, 120, 200)).save(source, format="PNG")
+        mock_file = BytesIO(source.getvalue())
+        mock_file.content_type = "image/png"
+
+        with patch.object(fs, "get", return_value=mock_file):
+            response = client.get(
+                f"/api/pets/{test_pet['_id']}/photo?w=128&h=128",
+                headers={"Authorization": f"Bearer {regular_user_token}"},
+            )
+
+        assert response.status_code == 200
+        assert response.content_type == "image/webp"
+        with Image.open(BytesIO(response.data)) as img:
+            assert img.size == (128, 102)
+
+    def test_get_pet_photo_resize_larger_than_source_returns_original(
+        self, client, mock_db, regular_user_token, test_pet
+    ):
+        """Test that asking for a size not smaller than the source skips re-encoding."""
+        from io import BytesIO
+        from PIL import Image
+        from web.app import db, fs
+        from bson import ObjectId
+        from unittest.mock import patch
+
+        photo_file_id = ObjectId()
+        db["pets"].update_one({"_id": test_pet["_id"]}, {"$set": {"photo_file_id": str(photo_file_id)}})
+
+        source = BytesIO()
+        Image.new("RGB", (64, 64), (10, 120, 200)).save(source, format="WEBP")
+        mock_file = BytesIO(source.getvalue())
+        mock_file.content_type = "image/webp"
+
+        with patch.object(fs, "get", return_value=mock_file):
+            response = client.get(
+                f"/api/pets/{test_pet['_id']}/photo?w=300&h=300",
+                headers={"Authorization": f"Bearer {regular_user_token}"},
+            )
+
+        assert response.status_code == 200
+        assert response.content_type == "image/webp"
+        assert response.data == source.getvalue()
+
     def test_get_pet_photo_invalid_pet_id(self, client, regular_user_token):
         """Test getting photo with invalid pet_id format."""
         response = client.get("/api/pets/invalid_id/photo", headers={"Authorization": f"Bearer {regular_user_token}"})
@@ -460,34 +688,26 @@ class TestPetManagement:
 
     def test_delete_pet_with_photo(self, client, mock_db, regular_user_token, test_pet):
         """Test that deleting a pet also deletes its photo from GridFS."""
-        from web.app import db, fs
-        from unittest.mock import patch
-        
-        # Add photo to pet
+        from web.app import db
+
+        # Add photo to pet (GridFS file document plus its chunks)
         photo_file_id = ObjectId()
+        db["fs.files"].insert_one({"_id": photo_file_id, "filename": "cat.webp"})
+        db["fs.chunks"].insert_many([{"files_id": photo_file_id, "n": n} for n in range(2)])
         db["pets"].update_one(
             {"_id": test_pet["_id"]},
             {"$set": {"photo_file_id": str(photo_file_id)}}
         )
-        
-        # Track if fs.delete was called
-        delete_called = False
-        original_delete = fs.delete
-        
-        def mock_delete(file_id):
-            nonlocal delete_called
-            delete_called = True
-            # Don't actually delete since we didn't create the file
-            
-        with patch.object(fs, 'delete', side_effect=mock_delete):
-            response = client.delete(
-                f"/api/pets/{test_pet['_id']}",
-                headers={"Authorization": f"Bearer {regular_user_token}"}
-            )
-        
+
+        response = client.delete(
+            f"/api/pets/{test_pet['_id']}",
+            headers={"Authorization": f"Bearer {regular_user_token}"}
+        )
+
         assert response.status_code == 200
-        assert delete_called, "Photo deletion should have been attempted"
-        
+        assert db["fs.files"].count_documents({"_id": photo_file_id}) == 0
+        assert db["fs.chunks"].count_documents({"files_id": photo_file_id}) == 0
+
         # Verify pet is deleted
         assert db["pets"].find_one({"_id": test_pet["_id"]}) is None
 
@@ -0,0 +1,211 @@
+"""Tests for validate_request_data (JSON and multipart/form-data validation)."""
+
+import json
+
+import pytest
+
+
+@pytest.mark.unit
+class TestValidateRequestData:
+    """Tests for validate_request_data helper."""
+
+    def test_json_body_valid(self, client):
+        """Valid JSON body is parsed into the model."""
+        from web.app import app
+        from web.pydantic_helpers import validate_request_data
+        from web.schemas import PetShareRequest
+
+        with app.test_request_context("/", method="POST", json={"username": "friend"}):
+            from flask import request
+
+            data, error = validate_request_data(request, PetShareRequest)
+
+        assert error is None
+        assert data.username == "friend"
+
+    def test_json_body_empty(self, client):
+        """Empty body returns a validation error."""
+        from web.app import app
+        from web.pydantic_helpers import validate_request_data
+        from web.schemas import PetShareRequest
+
+        with app.test_request_context("/", method="POST", data=b"", content_type="application/json"):
+            from flask import request
+
+            data, error = validate_request_data(request, PetShareRequest)
+
+        assert data is None
+        response, status = error
+        assert status == 422
+        assert response.get_json()["code"] == "validation_error"
+
+    def test_json_body_malformed(self, client):
+        """Malformed JSON body returns a validation error."""
+        from web.app import app
+        from web.pydantic_helpers import validate_request_data
+        from web.schemas import PetShareRequest
+
+        with app.test_request_context("/", method="POST", data=b"{not json", content_type="application/json"):
+            from flask import request
+
+            data, error = validate_request_data(request, PetShareRequest)
+
+        assert data is None
+        assert error[1] == 422
+
+    def test_unexpected_errors_propagate(self, client):
+        """Errors other than malformed input are left to the global error handler."""
+        from unittest.mock import MagicMock, patch
+
+        from web.app import app
+        from web.pydantic_helpers import validate_request_data
+        from web.schemas import PetShareRequest
+
+        adapter = MagicMock()
+        adapter.validate_json.side_effect = RuntimeError("boom")
+        with app.test_request_context("/", method="POST", json={"username": "friend"}):
+            from flask import request
+
+            with patch("web.pydantic_helpers._adapter", return_value=adapter):
+                with pytest.raises(RuntimeError):
+                    validate_request_data(request, PetShareRequest)
+
+    def test_json_body_model_error_message(self, client):
+        """Model validation errors return the first message without the pydantic prefix."""
+        from web.app import app
+        from web.pydantic_helpers import validate_request_data
+        from web.schemas import PetCreate
+
+        with app.test_request_context("/", method="POST", json={"name": "Cat", "birth_date": "15.03.2020"}):
+            from flask import request
+
+            data, error = validate_request_data(request, PetCreate, context="test")
+
+        assert data is None
+        response, status = error
+        assert status == 422
+        assert response.get_json()["error"] == "Неверный формат даты. Используйте YYYY-MM-DD"
+
+    def test_multipart_parses_json_fields(self, client):
+        """JSON-encoded form fields are decoded before validation."""
+        from web.app import app
+        from web.pydantic_helpers import validate_request_data
+        from web.schemas import PetCreate
+
+        tiles = {"order": ["weight"], "visible": {"weight": True}}
+        form = {"name": "Form Cat", "tiles_settings": json.dumps(tiles)}
+        with app.test_request_context("/", method="POST", data=form, content_type="multipart/form-data"):
+            from flask import request
+
+            data, error = validate_request_data(request, PetCreate)
+
+        assert error is None
+        assert data.name == "Form Cat"
+        assert data.tiles_settings.model_dump() == tiles
+
+    def test_multipart_keeps_plain_strings(self, client):
+        """JSON-looking values of plain string fields are not decoded."""
+        from web.app import app
+        from web.pydantic_helpers import validate_request_data
+        from web.schemas import PetCreate
+
+        form = {"name": '["Cat"]', "health_notes": '{"healthy": true}'}
+        with app.test_request_context("/", method="POST", data=form, content_type="multipart/form-data"):
+            from flask import request
+
+            data, error = validate_request_data(request, PetCreate)
+
+        assert error is None
+        assert data.name == '["Cat"]'
+        assert data.health_notes == '{"healthy": true}'
+
+    @pytest.mark.parametrize(
+        "content_type,expected",
+        [
+            ("multipart/form-data; boundary=abc", True),
+            ("application/x-multipart/form-data", False),
+            ("application/json", False),
+            (None, False),
+        ],
+    )
+    def test_is_multipart_request(self, content_type, expected):
+        """Multipart is detected by content type prefix, the same check the pet routes use."""
+        from web.app import app
+        from web.pydantic_helpers import is_multipart_request
+
+        with app.test_request_context("/", method="POST", data=b"", content_type=content_type):
+            from flask import request
+
+            assert is_multipart_request(request) is expected
+
+    def test_content_type_merely_containing_multipart_is_json(self, client):
+        """Only a content type starting with multipart/form-data is parsed as a form."""
+        from web.app import app
+        from web.pydantic_helpers import validate_request_data
+        from web.schemas import PetShareRequest
+
+        with app.test_request_context(
+            "/", method="POST", data=b'{"username": "friend"}', content_type="application/x-multipart/form-data"
+        ):
+            from flask import request
+
+            data, error = validate_request_data(request, PetShareRequest)
+
+        assert error is None
+        assert data.username == "friend"
+
+    def test_multipart_invalid_json_field(self, client):
+        """Malformed JSON in a structured field is reported for that field."""
+        from web.app import app
+        from web.pydantic_helpers import validate_request_data
+        from web.schemas import PetCreate
+
+        form = {"name": "Form Cat", "tiles_settings": '{"order": ['}
+        with app.test_request_context("/", method="POST", data=form, content_type="multipart/form-data"):
+            from flask import request
+
+            data, error = validate_request_data(request, PetCreate)
+
+        assert data is None
+        response, status = error
+        assert status == 422
+        assert response.get_json()["error"] == "Неверный JSON в поле tiles_settings"
+
+    def test_multipart_repeated_key_uses_first_value(self, client):
+        """Repeated form keys keep the first value, like MultiDict.to_dict()."""
+        from werkzeug.datastructures import MultiDict
+
+        from web.app import app
+        from web.pydantic_helpers import validate_request_data
+        from web.schemas import PetCreate
+
+        form = MultiDict([("name", "First"), ("name", "Second")])
+        with app.test_request_context("/", method="POST", data=form, content_type="multipart/form-data"):
+            from flask import request
+
+            data, error = validate_request_data(request, PetCreate)
+
+        assert error is None
+        assert data.name == "First"
+
+    def test_get_logger_caches_app_logger(self):
+        """The app logger is imported once and reused."""
+        from web import pydantic_helpers
+        from web.app import logger
+
+        assert pydantic_helpers._get_logger() is logger
+        assert pydantic_helpers._logger is logger
+
+
+@pytest.mark.unit
+class TestJsonFields:
+    """Tests for detection of structured (JSON-encoded) form fields."""
+
+    def test_json_fields_detects_nested_models(self):
+        """Only nested model/list/dict fields are treated as JSON fields."""
+        from web.pydantic_helpers import _json_fields
+        from web.schemas import MedicationCreate, PetCreate, PetShareRequest
+
+        assert _json_fields(PetCreate) == {"tiles_settings"}
+        assert _json_fields(PetShareRequest) == frozenset()
+        assert _json_fields(MedicationCreate) == {"schedule"}
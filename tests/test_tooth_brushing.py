@@ -234,3 +234,20 @@ def test_tooth_brushing_require_pet_id(client, admin_token):
     # Check for either our error format or flask-pydantic-spec format
     assert "error" in data or (isinstance(data, list) and len(data) > 0)
 
+
+def test_tooth_brushing_blank_brushing_type_uses_default(client, mock_db, admin_token, admin_pet):
+    """Test that an empty brushing_type from an unselected form field falls back to the default."""
+    now = datetime.now(timezone.utc)
+    response = client.post(
+        "/api/tooth_brushing",
+        json={
+            "pet_id": str(admin_pet["_id"]),
+            "date": now.strftime("%Y-%m-%d"),
+            "time": now.strftime("%H:%M"),
+            "brushing_type": "",
+        },
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+
+    assert response.status_code == 201
+    assert mock_db["tooth_brushing"].find_one({})["brushing_type"] == "Щетка"
@@ -4,6 +4,8 @@ import pytest
 from datetime import datetime, timezone
 import bcrypt
 
+from web.security import PASSWORD_HASHER
+
 
 @pytest.mark.admin
 class TestUserManagement:
@@ -90,6 +92,119 @@ class TestUserManagement:
         data = response.get_json()
         assert "error" in data or isinstance(data, list)
 
+    def test_create_users_bulk(self, client, mock_db, auth_headers, regular_user):
+        """Bulk creation inserts new users and reports existing and repeated usernames per row."""
+        response = client.post(
+            "/api/users/bulk",
+            json={
+                "users": [
+                    {"username": "bulk1", "password": "bulkpass1"},
+                    {"username": regular_user["username"], "password": "bulkpass2"},
+                    {"username": "bulk2", "password": "bulkpass3", "full_name": "Bulk Two"},
+                    {"username": "bulk1", "password": "bulkpass4"},
+                ]
+            },
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 201
+        data = response.get_json()
+        assert [result["created"] for result in data["results"]] == [True, False, True, False]
+        assert data["results"][1]["code"] == "user_exists"
+        assert data["results"][3]["code"] == "user_exists"
+
+        from web.app import db
+
+        user = db["users"].find_one({"username": "bulk2"})
+        assert user["full_name"] == "Bulk Two"
+        assert PASSWORD_HASHER.verify(user["password_hash"], "bulkpass3")
+        assert db["users"].count_documents({"username": "bulk1"}) == 1
+
+    def test_create_users_bulk_requires_users(self, client, auth_headers):
+        """An empty user list is rejected."""
+        response = client.post("/api/users/bulk", json={"users": []}, headers=auth_headers)
+
+        assert response.status_code == 422
+
+    def test_create_users_bulk_rejects_oversized_batch(self, client, auth_headers):
+        """Batches larger than the hashing budget allows are rejected before any hashing."""
+        users = [{"username": f"bulk{i}", "password": "bulkpass1"} for i in range(51)]
+        response = client.post("/api/users/bulk", json={"users": users}, headers=auth_headers)
+
+        assert response.status_code == 422
+
+    def test_create_users_bulk_reports_hash_timeout(self, client, mock_db, auth_headers):
+        """Rows whose password hash misses the deadline are reported and not inserted."""
+        from concurrent.futures import Future
+        from unittest.mock import patch
+        from web.security import submit_password_hash
+
+        def submit(password):
+            return Future() if password == "slowpass1" else submit_password_hash(password)
+
+        with (
+            patch("web.users.submit_password_hash", side_effect=submit),
+            patch("web.users.BULK_PASSWORD_HASH_TIMEOUT", 0.5),
+        ):
+            response = client.post(
+                "/api/users/bulk",
+                json={
+                    "users": [
+                        {"username": "slow1", "password": "slowpass1"},
+                        {"username": "fast1", "password": "fastpass1"},
+                    ]
+                },
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 201
+        data = response.get_json()
+        assert [result["created"] for result in data["results"]] == [False, True]
+        assert data["results"][0]["code"] == "internal_error"
+
+        from web.app import db
+
+        assert db["users"].count_documents({"username": "slow1"}) == 0
+        assert db["users"].count_documents({"username": "fast1"}) == 1
+
+    def test_create_user_hash_timeout(self, client, mock_db, auth_headers):
+        """A password hash that does not finish in time returns internal_error and creates nothing."""
+        from concurrent.futures import Future
+        from unittest.mock import patch
+
+        with (
+            patch("web.users.submit_password_hash", return_value=Future()),
+            patch("web.users.PASSWORD_HASH_TIMEOUT", 0.1),
+        ):
+            response = client.post(
+                "/api/users", json={"username": "slowuser", "password": "slowpass1"}, headers=auth_headers
+            )
+
+        assert response.status_code == 500
+        assert response.get_json()["code"] == "internal_error"
+
+        from web.app import db
+
+        assert db["users"].count_documents({"username": "slowuser"}) == 0
+
+    def test_reset_password_hash_timeout(self, client, mock_db, auth_headers, regular_user):
+        """A password reset whose hash does not finish in time returns internal_error."""
+        from concurrent.futures import Future
+        from unittest.mock import patch
+
+        with (
+            patch("web.users.submit_password_hash", return_value=Future()),
+            patch("web.users.PASSWORD_HASH_TIMEOUT", 0.1),
+        ):
+            response = client.post(
+                f"/api/users/{regular_user['username']}/reset-password",
+                json={"password": "slowpass1"},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 500
+        assert response.get_json()["code"] == "internal_error"
+
     def test_get_user_success(self, client, mock_db, auth_headers, regular_user):
         """Test getting a specific user."""
         response = client.get(f"/api/users/{regular_user['username']}", headers=auth_headers)
@@ -182,7 +297,7 @@ class TestUserManagement:
         from web.app import db
 
         user = db["users"].find_one({"username": regular_user["username"]})
-        assert bcrypt.checkpw(new_password.encode(), user["password_hash"].encode())
+        assert PASSWORD_HASHER.verify(user["password_hash"], new_password)
 
     def test_reset_user_password_missing_password(self, client, auth_headers, regular_user):
         """Test resetting password without providing new password."""
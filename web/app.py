@@ -3,8 +3,11 @@
 import logging
 import os
 import sys
+from functools import lru_cache
 
+import orjson
 from flask import Flask, make_response, redirect, render_template, request, send_from_directory, url_for
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.errors import RateLimitExceeded
@@ -47,6 +50,32 @@ def setup_logging(app):
     return app.logger
 
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib json module.
+
+    Datetimes are passed through to Flask's default handler so they keep the
+    HTTP date format; other unsupported types (e.g. UUID, Markup) fall back to it too.
+    Non-string dict keys are stringified, as the stdlib json module does.
+    """
+
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def _dumpb(self, obj, indent=None) -> bytes:
+        option = self.option | orjson.OPT_INDENT_2 if indent else self.option
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._dumpb(obj, kwargs.get("indent")).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._dumpb(obj, indent) + b"\n", mimetype=self.mimetype)
+
+
 # Initialize GridFS for file storage
 fs = GridFS(db)
 
@@ -56,6 +85,7 @@ app = Flask(
     template_folder=FLASK_CONFIG["template_folder"],
     static_folder=FLASK_CONFIG["static_folder"],
 )
+app.json = OrjsonProvider(app)
 CORS(app, supports_credentials=True)
 app.secret_key = FLASK_CONFIG["secret_key"]
 app.config["JSONIFY_PRETTYPRINT_REGULAR"] = FLASK_CONFIG["jsonify_prettyprint_regular"]
@@ -170,6 +200,20 @@ api.spec["components"]["securitySchemes"] = {
 api.spec["security"] = [{"bearerAuth": []}]
 
 
+@lru_cache(maxsize=1)
+def _openapi_json() -> bytes:
+    """Serialize the (already finalized) OpenAPI spec once, straight to bytes."""
+    return orjson.dumps(api.spec, default=app.json.default, option=app.json.option)
+
+
+def openapi_spec():
+    """Serve the OpenAPI spec from the cached serialized document."""
+    return app.response_class(_openapi_json(), mimetype="application/json")
+
+
+app.view_functions["openapi"] = openapi_spec
+
+
 # Error handler for rate limit exceeded
 @app.errorhandler(RateLimitExceeded)
 def handle_rate_limit_exceeded(e):
@@ -246,6 +290,13 @@ def dashboard():
     return render_template("dashboard.html", username=username)
 
 
+@app.cli.command("create-indexes")
+def create_indexes_command():
+    """Create the MongoDB indexes used by authentication and user management."""
+    security.ensure_indexes()
+
+
 if __name__ == "__main__":
     security.ensure_default_admin()
+    security.ensure_indexes()
     app.run(host="0.0.0.0", port=5000, debug=FLASK_CONFIG["debug"])
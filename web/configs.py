@@ -56,10 +56,18 @@ def load_config() -> Dict[str, Any]:
             "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
+        # API settings
+        "api": {
+            # Re-validate responses built from trusted MongoDB documents (useful in development/tests)
+            "validate_responses": os.getenv("VALIDATE_API_RESPONSE", "False").lower() == "true",
+        },
         # Admin settings
         "admin": {
             "username": os.getenv("ADMIN_USERNAME", "admin"),
             "password_hash": os.getenv("ADMIN_PASSWORD_HASH"),
+            # Argon2id cost for new password hashes (OWASP: 46 MiB, 1-3 passes; memory in KiB)
+            "argon2_time_cost": int(os.getenv("ARGON2_TIME_COST", "3")),
+            "argon2_memory_cost": int(os.getenv("ARGON2_MEMORY_COST", str(46 * 1024))),
         },
         # MongoDB settings
         "mongodb": {
@@ -107,4 +115,5 @@ JWT_CONFIG = _config["jwt"]
 RATE_LIMIT_CONFIG = _config["rate_limit"]
 LOGGING_CONFIG = _config["logging"]
 ADMIN_CONFIG = _config["admin"]
+API_CONFIG = _config["api"]
 MONGODB_CONFIG = _config["mongodb"]
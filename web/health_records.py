@@ -11,6 +11,7 @@ import web.app as app  # Import app module to access db and logger
 from flask import Blueprint, jsonify, request, g
 from flask_pydantic_spec import Request, Response
 from web.app import api
+from web.configs import API_CONFIG
 from web.errors import error_response
 from web.messages import get_message
 from web.decorators import require_pet_access, require_record_access
@@ -105,7 +106,12 @@ def add_asthma_attack():
 @health_records_bp.route("/api/asthma", methods=["GET"])
 @api.validate(
     query=PetIdPaginationQuery,
-    resp=Response(HTTP_200=AsthmaAttackListResponse, HTTP_422=ErrorResponse, HTTP_403=ErrorResponse),
+    resp=Response(
+        HTTP_200=AsthmaAttackListResponse,
+        HTTP_422=ErrorResponse,
+        HTTP_403=ErrorResponse,
+        validate=API_CONFIG["validate_responses"],
+    ),
     tags=["health-records"],
 )
 @require_pet_access
@@ -294,7 +300,12 @@ def add_defecation():
 @health_records_bp.route("/api/defecation", methods=["GET"])
 @api.validate(
     query=PetIdPaginationQuery,
-    resp=Response(HTTP_200=DefecationListResponse, HTTP_422=ErrorResponse, HTTP_403=ErrorResponse),
+    resp=Response(
+        HTTP_200=DefecationListResponse,
+        HTTP_422=ErrorResponse,
+        HTTP_403=ErrorResponse,
+        validate=API_CONFIG["validate_responses"],
+    ),
     tags=["health-records"],
 )
 @require_pet_access
@@ -476,7 +487,12 @@ def add_litter():
 @health_records_bp.route("/api/litter", methods=["GET"])
 @api.validate(
     query=PetIdPaginationQuery,
-    resp=Response(HTTP_200=LitterChangeListResponse, HTTP_422=ErrorResponse, HTTP_403=ErrorResponse),
+    resp=Response(
+        HTTP_200=LitterChangeListResponse,
+        HTTP_422=ErrorResponse,
+        HTTP_403=ErrorResponse,
+        validate=API_CONFIG["validate_responses"],
+    ),
     tags=["health-records"],
 )
 @require_pet_access
@@ -654,7 +670,12 @@ def add_weight():
 @health_records_bp.route("/api/weight", methods=["GET"])
 @api.validate(
     query=PetIdPaginationQuery,
-    resp=Response(HTTP_200=WeightRecordListResponse, HTTP_422=ErrorResponse, HTTP_403=ErrorResponse),
+    resp=Response(
+        HTTP_200=WeightRecordListResponse,
+        HTTP_422=ErrorResponse,
+        HTTP_403=ErrorResponse,
+        validate=API_CONFIG["validate_responses"],
+    ),
     tags=["health-records"],
 )
 @require_pet_access
@@ -828,7 +849,12 @@ def add_feeding():
 @health_records_bp.route("/api/feeding", methods=["GET"])
 @api.validate(
     query=PetIdPaginationQuery,
-    resp=Response(HTTP_200=FeedingListResponse, HTTP_422=ErrorResponse, HTTP_403=ErrorResponse),
+    resp=Response(
+        HTTP_200=FeedingListResponse,
+        HTTP_422=ErrorResponse,
+        HTTP_403=ErrorResponse,
+        validate=API_CONFIG["validate_responses"],
+    ),
     tags=["health-records"],
 )
 @require_pet_access
@@ -1001,7 +1027,12 @@ def add_eye_drops():
 @health_records_bp.route("/api/eye_drops", methods=["GET"])
 @api.validate(
     query=PetIdPaginationQuery,
-    resp=Response(HTTP_200=EyeDropsListResponse, HTTP_422=ErrorResponse, HTTP_403=ErrorResponse),
+    resp=Response(
+        HTTP_200=EyeDropsListResponse,
+        HTTP_422=ErrorResponse,
+        HTTP_403=ErrorResponse,
+        validate=API_CONFIG["validate_responses"],
+    ),
     tags=["health-records"],
 )
 @require_pet_access
@@ -1180,7 +1211,12 @@ def add_tooth_brushing():
 @health_records_bp.route("/api/tooth_brushing", methods=["GET"])
 @api.validate(
     query=PetIdPaginationQuery,
-    resp=Response(HTTP_200=ToothBrushingListResponse, HTTP_422=ErrorResponse, HTTP_403=ErrorResponse),
+    resp=Response(
+        HTTP_200=ToothBrushingListResponse,
+        HTTP_422=ErrorResponse,
+        HTTP_403=ErrorResponse,
+        validate=API_CONFIG["validate_responses"],
+    ),
     tags=["health-records"],
 )
 @require_pet_access
@@ -1357,7 +1393,12 @@ def add_ear_cleaning():
 @health_records_bp.route("/api/ear_cleaning", methods=["GET"])
 @api.validate(
     query=PetIdPaginationQuery,
-    resp=Response(HTTP_200=EarCleaningListResponse, HTTP_422=ErrorResponse, HTTP_403=ErrorResponse),
+    resp=Response(
+        HTTP_200=EarCleaningListResponse,
+        HTTP_422=ErrorResponse,
+        HTTP_403=ErrorResponse,
+        validate=API_CONFIG["validate_responses"],
+    ),
     tags=["health-records"],
 )
 @require_pet_access
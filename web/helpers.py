@@ -4,9 +4,11 @@ This module is intentionally independent from `web.app` to avoid circular import
 Helpers are imported into `web.app` and used by blueprints via `web.app.*`.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from io import BytesIO
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 
 from bson import ObjectId
 from bson.errors import InvalidId
@@ -20,6 +22,10 @@ from web.errors import error_response
 
 logger = app.logger
 
+# Pool for Pillow encoding that overlaps other request I/O (such as deleting the replaced photo);
+# libjpeg/libwebp release the GIL while encoding.
+IMG_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="img")
+
 
 def parse_datetime(date_str, time_str=None, allow_future=True, max_future_days=1, max_past_years=50):
     """
@@ -238,6 +244,31 @@ def apply_pagination(query, page: int, page_size: int):
     return query.skip(skip).limit(page_size), skip
 
 
+def bulk_gridfs_delete(ids: Iterable) -> int:
+    """
+    Delete several GridFS files in two round-trips regardless of how many ids are given.
+
+    `GridFS.delete` issues one request to `fs.files` and one to `fs.chunks` per file;
+    this helper removes all files and their chunks with a single `delete_many` each.
+
+    Args:
+        ids: File ids (ObjectId or their string form); empty/None values are skipped
+
+    Returns:
+        Number of deleted `fs.files` documents
+
+    Raises:
+        InvalidId: If one of the ids is not a valid ObjectId
+    """
+    object_ids = [ObjectId(file_id) for file_id in ids if file_id]
+    if not object_ids:
+        return 0
+
+    result = app.db["fs.files"].delete_many({"_id": {"$in": object_ids}})
+    app.db["fs.chunks"].delete_many({"files_id": {"$in": object_ids}})
+    return result.deleted_count
+
+
 def optimize_image(file_storage: FileStorage, max_width: int = 1920, max_height: int = 1920, quality: int = 85) -> Optional[Tuple[BytesIO, str]]:
     """
     Optimize image by converting to WebP format and resizing if necessary.
@@ -8,6 +8,7 @@ from datetime import datetime
 
 import web.app as app
 from web.app import api
+from web.configs import API_CONFIG
 from web.errors import error_response
 from web.decorators import require_pet_access, require_record_access
 from web.helpers import (
@@ -61,7 +62,11 @@ def add_medication():
 @medications_bp.route("/api/medications", methods=["GET"])
 @api.validate(
     query=MedicationListQuery,
-    resp=Response(HTTP_200=MedicationListResponse, HTTP_403=ErrorResponse),
+    resp=Response(
+        HTTP_200=MedicationListResponse,
+        HTTP_403=ErrorResponse,
+        validate=API_CONFIG["validate_responses"],
+    ),
     tags=["medications"],
 )
 @require_pet_access
@@ -333,7 +338,11 @@ def log_intake(id):
 @medications_bp.route("/api/medications/intakes", methods=["GET"])
 @api.validate(
     query=PetIdPaginationQuery,
-    resp=Response(HTTP_200=MedicationIntakeListResponse, HTTP_403=ErrorResponse),
+    resp=Response(
+        HTTP_200=MedicationIntakeListResponse,
+        HTTP_403=ErrorResponse,
+        validate=API_CONFIG["validate_responses"],
+    ),
     tags=["medications"],
 )
 @require_pet_access
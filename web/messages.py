@@ -27,6 +27,7 @@ MESSAGES: Dict[str, MessageDef] = {
     "pet_unshared": MessageDef("Доступ убран у пользователя {username}"),
     # User messages
     "user_created": MessageDef("Пользователь создан"),
+    "users_bulk_created": MessageDef("Создано пользователей: {created}"),
     "user_updated": MessageDef("Пользователь обновлен"),
     "user_deactivated": MessageDef("Пользователь деактивирован"),
     "user_password_reset": MessageDef("Пароль изменен"),
@@ -6,16 +6,18 @@ from io import BytesIO
 from PIL import Image
 from bson import ObjectId
 from bson.errors import InvalidId
-from flask import Blueprint, jsonify, make_response, request, url_for
+from flask import Blueprint, jsonify, make_response, request, send_file, url_for
 from flask_pydantic_spec import Request, Response
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
 
 from web.app import api, logger  # shared logger and api
+from web.configs import API_CONFIG
 from web.security import login_required, get_current_user
 import web.app as app  # to access patched app.db/app.fs in tests
-from web.helpers import get_pet_and_validate, parse_date, optimize_image
+from web.helpers import IMG_POOL, get_pet_and_validate, parse_date, optimize_image, bulk_gridfs_delete
 from web.errors import error_response
 from web.messages import get_message
-from web.pydantic_helpers import validate_request_data
+from web.pydantic_helpers import is_multipart_request, validate_request_data
 from web.schemas import (
     PetCreate,
     PetUpdate,
@@ -75,7 +77,7 @@ def convert_objectid_to_str(obj):
 
 @pets_bp.route("/api/pets", methods=["GET"])
 @login_required
-@api.validate(resp=Response(HTTP_200=PetListResponse), tags=["pets"])
+@api.validate(resp=Response(HTTP_200=PetListResponse, validate=API_CONFIG["validate_responses"]), tags=["pets"])
 def get_pets():
     """Get list of all pets accessible to current user."""
     username, auth_error = get_current_user()
@@ -86,12 +88,10 @@ def get_pets():
 
     processed_pets = []
     for pet in pets:
-        # Convert all ObjectId instances to strings recursively
-        pet = convert_objectid_to_str(pet)
-        
-        # Ensure _id is string (already converted by convert_objectid_to_str, but double-check)
+        # ObjectId fields are known (_id, photo_file_id, shared_with), convert them explicitly
         pet["_id"] = str(pet["_id"])
-        
+        pet["shared_with"] = [str(uid) for uid in pet.get("shared_with") or []]
+
         # Convert photo_file_id to string if it exists
         if pet.get("photo_file_id"):
             pet["photo_file_id"] = str(pet["photo_file_id"])
@@ -107,16 +107,12 @@ def get_pets():
         
         # Ensure tiles_settings is present (use default if missing)
         tiles_settings = get_tiles_settings(pet)
-        # Convert any ObjectId in tiles_settings to string
-        pet["tiles_settings"] = convert_objectid_to_str(tiles_settings)
-        
-        # Convert any ObjectId in shared_with to string (if present)
-        if pet.get("shared_with"):
-            pet["shared_with"] = [str(uid) if isinstance(uid, ObjectId) else uid for uid in pet["shared_with"]]
-        
-        # Final pass: convert any remaining ObjectId instances
-        pet = convert_objectid_to_str(pet)
-        
+        # The default is a JSON-ready constant shared by reference (no per-pet copy);
+        # only user-supplied settings may contain untyped nested data (e.g. ObjectId)
+        if tiles_settings is not DEFAULT_TILES_SETTINGS:
+            tiles_settings = convert_objectid_to_str(tiles_settings)
+        pet["tiles_settings"] = tiles_settings
+
         processed_pets.append(pet)
 
     return jsonify({"pets": processed_pets})
@@ -139,7 +135,7 @@ def create_pet():
         # Validate request data (supports both JSON and multipart/form-data)
         # For JSON: use request.context.body (validated by @api.validate)
         # For multipart: use validate_request_data helper
-        is_multipart = request.content_type and "multipart/form-data" in request.content_type
+        is_multipart = is_multipart_request(request)
         if is_multipart:
             data, validation_error = validate_request_data(request, PetCreate, context="pet creation")
             if validation_error:
@@ -232,6 +228,7 @@ def create_pet():
         HTTP_403=ErrorResponse,
         HTTP_404=ErrorResponse,
         HTTP_500=ErrorResponse,
+        validate=API_CONFIG["validate_responses"],
     ),
     tags=["pets"],
 )
@@ -296,7 +293,7 @@ def update_pet(pet_id):
         if access_error:
             return access_error[0], access_error[1]
 
-        is_multipart = request.content_type and "multipart/form-data" in request.content_type
+        is_multipart = is_multipart_request(request)
         if is_multipart:
             data, validation_error = validate_request_data(request, PetUpdate, context="pet update")
             if validation_error:
@@ -312,18 +309,20 @@ def update_pet(pet_id):
             if "photo_file" in request.files:
                 photo_file = request.files["photo_file"]
                 if photo_file.filename:
+                    # Optimize image to WebP format in the pool while the old photo is being deleted
+                    optimize_future = IMG_POOL.submit(optimize_image, photo_file)
+
                     # Delete old photo if exists
                     old_photo_id = pet.get("photo_file_id") if pet else None
                     if old_photo_id:
                         try:
-                            app.fs.delete(ObjectId(old_photo_id))
+                            bulk_gridfs_delete([old_photo_id])
                         except Exception as e:
                             logger.warning(
                                 f"Failed to delete old photo: photo_id={old_photo_id}, pet_id={pet_id}, error={e}"
                             )
 
-                    # Optimize image to WebP format
-                    optimized_result = optimize_image(photo_file)
+                    optimized_result = optimize_future.result()
                     if optimized_result:
                         optimized_file, content_type = optimized_result
                         # Generate filename with .webp extension
@@ -352,7 +351,7 @@ def update_pet(pet_id):
                     old_photo_id = pet.get("photo_file_id") if pet else None
                     if old_photo_id:
                         try:
-                            app.fs.delete(ObjectId(old_photo_id))
+                            bulk_gridfs_delete([old_photo_id])
                         except Exception as e:
                             logger.warning(
                                 f"Failed to delete photo: photo_id={old_photo_id}, pet_id={pet_id}, error={e}"
@@ -452,12 +451,14 @@ def share_pet(pet_id):
         if share_username == username:
             return error_response("validation_error_self_share")
 
-        shared_with = pet.get("shared_with", []) if pet else []
-        if share_username in shared_with:
+        # Single round-trip: the filter only matches when the user is not shared yet
+        result = app.db["pets"].update_one(
+            {"_id": ObjectId(pet_id), "shared_with": {"$ne": share_username}},
+            {"$addToSet": {"shared_with": share_username}},
+        )
+        if result.matched_count == 0:
             return error_response("validation_error_already_shared")
 
-        app.db["pets"].update_one({"_id": ObjectId(pet_id)}, {"$addToSet": {"shared_with": share_username}})
-
         logger.info(f"Pet shared: id={pet_id}, owner={username}, shared_with={share_username}")
         return get_message("pet_shared", username=share_username)
 
@@ -533,8 +534,9 @@ def delete_pet(pet_id):
             ("medications", {"pet_id": pet_id}),
         ]
         
-        # Delete photo from GridFS if exists
+        # Collect GridFS files owned by the pet (photo) to delete in one batch
         old_photo_id = pet.get("photo_file_id") if pet else None
+        photo_file_ids = [old_photo_id] if old_photo_id else []
 
         # Try to use transaction if available
         try:
@@ -606,10 +608,10 @@ def delete_pet(pet_id):
                 # Re-raise if it's not a transaction-related error
                 raise
 
-        # Delete photo from GridFS (outside transaction as GridFS doesn't support transactions)
-        if old_photo_id:
+        # Delete photo files from GridFS (outside transaction as GridFS doesn't support transactions)
+        if photo_file_ids:
             try:
-                app.fs.delete(ObjectId(old_photo_id))
+                bulk_gridfs_delete(photo_file_ids)
                 logger.info(f"Deleted photo {old_photo_id} for pet {pet_id}")
             except Exception as photo_error:
                 # Log but don't fail the request
@@ -663,11 +665,22 @@ def get_pet_photo(pet_id):
 
         try:
             photo_file = app.fs.get(ObjectId(photo_file_id))
-            photo_data = photo_file.read()
             content_type = photo_file.content_type or "image/jpeg"
 
-            # If resizing requested
-            if (width or height) and content_type.startswith("image/"):
+            if not (width or height) or not content_type.startswith("image/"):
+                # No resizing: stream the GridFS file as is instead of reading it into memory.
+                # werkzeug cannot size a GridOut, so pass its length for Content-Length and Range handling
+                response = send_file(
+                    photo_file,
+                    mimetype=content_type,
+                    conditional=False,
+                    etag=f"{photo_file_id}_{width}_{height}",
+                    max_age=31536000,
+                )
+                response.content_length = photo_file.length
+                response = response.make_conditional(request, accept_ranges=True, complete_length=photo_file.length)
+            else:
+                photo_data = photo_file.read()
                 try:
                     img = Image.open(BytesIO(photo_data))
                     
@@ -677,7 +690,16 @@ def get_pet_photo(pet_id):
                     elif height and not width:
                         width = int(img.width * (height / img.height))
                     
-                    if width and height:
+                    # thumbnail() never upscales, so a size covering the source would only re-encode
+                    # the same pixels: serve the original bytes in that case
+                    if width and height and (width < img.width or height < img.height):
+                        # Decode JPEG at reduced scale (1/2..1/8) and shrink by an integer factor
+                        # before LANCZOS so only ~2x the target pixels are resampled
+                        if img.format == "JPEG":
+                            img.draft(None, (width * 2, height * 2))
+                        factor = max(1, min(img.width // (width * 2), img.height // (height * 2)))
+                        if factor > 1:
+                            img = img.reduce(factor)
                         img.thumbnail((width, height), Image.Resampling.LANCZOS)
                         
                         output = BytesIO()
@@ -690,13 +712,18 @@ def get_pet_photo(pet_id):
                     logger.warning(f"Resizing failed: {resize_err}")
                     # Fallback to original data if resizing fails
 
-            response = make_response(photo_data)
-            response.headers.set("Content-Type", content_type)
+                response = make_response(photo_data)
+                response.headers.set("Content-Type", content_type)
+                response.headers.set("ETag", f'"{photo_file_id}_{width}_{height}"')
+
             response.headers.set("Content-Disposition", "inline")
             response.headers.set("Cache-Control", "public, max-age=31536000, immutable")
-            response.headers.set("ETag", f'"{photo_file_id}_{width}_{height}"')
             logger.info(f"Pet photo retrieved: pet_id={pet_id}, user={username}, size={width}x{height}")
             return response
+        except RequestedRangeNotSatisfiable as e:
+            photo_file.close()
+            # Returned directly: the global handler would turn this HTTPException into a 500 for /api/ paths
+            return e.get_response()
         except Exception as e:
             logger.error(f"Error retrieving pet photo: pet_id={pet_id}, user={username}, error={e}", exc_info=True)
             return error_response("upload_error")
@@ -4,15 +4,56 @@ This module provides helpers to unify validation of JSON and multipart/form-data
 requests using Pydantic models, avoiding code duplication.
 """
 
-import json
-from typing import TypeVar, Type, Tuple, Optional
+from functools import lru_cache
+from typing import FrozenSet, TypeVar, Type, Tuple, Optional, Union, get_args, get_origin
+
+import orjson
 from flask import Request
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from web.errors import error_response
 
 T = TypeVar("T", bound=BaseModel)
 
+_logger = None
+
+
+def _get_logger():
+    """Return the app logger, importing it on first use (web.app imports this module)."""
+    global _logger
+    if _logger is None:
+        from web.app import logger
+
+        _logger = logger
+    return _logger
+
+
+@lru_cache(maxsize=None)
+def _adapter(model_class: Type[T]) -> TypeAdapter:
+    """Return a cached TypeAdapter giving direct access to the model's compiled validator."""
+    return TypeAdapter(model_class)
+
+
+def _is_structured(annotation) -> bool:
+    """Check if annotation is a nested model, list or dict (optionally wrapped in Optional/Union)."""
+    origin = get_origin(annotation)
+    if origin is Union:
+        return any(_is_structured(arg) for arg in get_args(annotation) if arg is not type(None))
+    if origin in (list, dict):
+        return True
+    return annotation in (list, dict) or (isinstance(annotation, type) and issubclass(annotation, BaseModel))
+
+
+@lru_cache(maxsize=None)
+def _json_fields(model_class: Type[T]) -> FrozenSet[str]:
+    """Names of model fields that may be sent as JSON strings in multipart/form-data."""
+    return frozenset(name for name, field in model_class.model_fields.items() if _is_structured(field.annotation))
+
+
+def is_multipart_request(request: Request) -> bool:
+    """Check whether the request body is multipart/form-data (matched by prefix, ignoring the boundary)."""
+    return (request.content_type or "").startswith("multipart/form-data")
+
 
 def validate_request_data(
     request: Request, model_class: Type[T], context: str = ""
@@ -41,25 +82,28 @@ def validate_request_data(
         # Use data.name, data.birth_date, etc.
         ```
     """
+    adapter = _adapter(model_class)
+    is_multipart = is_multipart_request(request)
     try:
-        # Check if request is multipart/form-data
-        if request.content_type and "multipart/form-data" in request.content_type:
-            # Validate form data
-            data_dict = request.form.to_dict()
-            # Parse JSON strings in form data (e.g., tiles_settings)
-            for key, value in data_dict.items():
-                if isinstance(value, str) and (value.startswith('{') or value.startswith('[')):
+        if is_multipart:
+            # Validate form data, parsing JSON strings only for structured fields (e.g., tiles_settings).
+            # First value per key, as MultiDict.to_dict() would return, without the intermediate dict
+            json_fields = _json_fields(model_class)
+            data_dict = {}
+            for key, value in request.form.items(multi=False):
+                if key in json_fields and value and value[0] in "{[":
                     try:
-                        data_dict[key] = json.loads(value)
-                    except (json.JSONDecodeError, ValueError):
-                        pass  # Keep as string if not valid JSON
-            validated_data = model_class.model_validate(data_dict)
+                        value = orjson.loads(value)
+                    except orjson.JSONDecodeError:
+                        return None, error_response("validation_error", f"Неверный JSON в поле {key}")
+                data_dict[key] = value
+            validated_data = adapter.validate_python(data_dict)
         else:
-            # Validate JSON data
-            json_data = request.get_json()
-            if json_data is None:
+            # Validate JSON data: pydantic-core parses and validates the raw body in one pass
+            body = request.get_data(cache=False)
+            if not body:
                 return None, error_response("validation_error")
-            validated_data = model_class.model_validate(json_data)
+            validated_data = adapter.validate_json(body)
 
         return validated_data, None
 
@@ -67,8 +111,7 @@ def validate_request_data(
         # Pydantic validation errors are handled by the global error handler
         # but we return a generic validation error here for consistency
         if context:
-            from web.app import logger
-            logger.warning(f"Validation error in {context}: {e}")
+            _get_logger().warning(f"Validation error in {context}: {e}")
         
         # Get first error message
         errors = e.errors()
@@ -79,10 +122,10 @@ def validate_request_data(
             return None, error_response("validation_error", msg)
             
         return None, error_response("validation_error", str(e))
-    except Exception as e:
-        # Handle other unexpected errors
+    except (ValueError, KeyError, UnicodeDecodeError, TypeError) as e:
+        # Malformed input that did not reach model validation; anything else
+        # propagates to the global error handler in web.app
         if context:
-            from web.app import logger
-            logger.warning(f"Unexpected error validating {context}: {e}")
+            _get_logger().warning(f"Unexpected error validating {context}: {e}")
         return None, error_response("validation_error", str(e))
 
@@ -5,39 +5,118 @@ Naming Convention:
 - See docs/api-naming-conventions.md for full naming rules
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, List, Annotated, Any
-from pydantic import BaseModel, Field, field_validator, ConfigDict, StringConstraints
+from datetime import date
+from functools import lru_cache
+from typing import Optional, List, Annotated, Any, Literal
+from pydantic import AfterValidator, BaseModel, BeforeValidator, Field, ConfigDict, StringConstraints
+
+
+def _is_objectid(v: str) -> str:
+    """Validate a 24-char hex ObjectId string with a single C-level bytes.fromhex call."""
+    try:
+        # bytes.fromhex skips whitespace, so also check that all 12 bytes were decoded
+        if len(v) == 24 and len(bytes.fromhex(v)) == 12:
+            return v
+    except ValueError:
+        pass
+    raise ValueError("Неверный формат ObjectId")
+
 
 # Custom type for ObjectId strings
-ObjectIdString = Annotated[str, StringConstraints(pattern=r"^[0-9a-fA-F]{24}$")]
+ObjectIdString = Annotated[str, AfterValidator(_is_objectid)]
 
 
-def validate_date_logic(v: str, allow_future: bool = True, max_future_days: int = 1, max_past_years: int = 50):
-    """Common logic for date validation."""
-    if not v:
-        return v
+def _parse_ymd(v: str) -> date:
+    """Parse a YYYY-MM-DD string (same inputs as strptime "%Y-%m-%d") without strptime."""
+    if len(v) == 10 and v[4] == "-" and v[7] == "-" and v.isascii():
+        # Canonical zero-padded form: C-level parser (the dash checks exclude ISO week dates like 2024-W03-1)
+        return date.fromisoformat(v)
+    year, month, day = v.split("-")
+    if len(year) != 4 or not 1 <= len(month) <= 2 or not 1 <= len(day) <= 2:
+        raise ValueError(v)
+    if not (year.isdigit() and month.isdigit() and day.isdigit()):
+        raise ValueError(v)
+    return date(int(year), int(month), int(day))
+
+
+_MAX_PAST_YEARS = 50
+_MAX_PAST_DAYS = _MAX_PAST_YEARS * 365
+
+
+@lru_cache(maxsize=1024)
+def _date_ordinal(v: str) -> int:
+    """Parse a YYYY-MM-DD string into a day ordinal (cached: dates repeat heavily in bulk inserts)."""
     try:
-        dt = datetime.strptime(v, "%Y-%m-%d")
+        return _parse_ymd(v).toordinal()
     except ValueError:
         raise ValueError("Неверный формат даты. Используйте YYYY-MM-DD")
 
-    now = datetime.now()
-    if not allow_future and dt.date() > now.date():
-        raise ValueError("Дата не может быть в будущем")
 
-    if allow_future:
-        max_future = now + timedelta(days=max_future_days)
-        if dt > max_future:
-            raise ValueError(f"Дата не может быть более чем на {max_future_days} день в будущем")
+def _check_date_bounds(v: str, max_future_days: int) -> str:
+    """Check a date against today as integer day ordinals; max_future_days=0 forbids future dates."""
+    if not v:
+        return v
+    day = _date_ordinal(v)
+    today = date.today().toordinal()
+    if day > today + max_future_days:
+        if not max_future_days:
+            raise ValueError("Дата не может быть в будущем")
+        raise ValueError(f"Дата не может быть более чем на {max_future_days} день в будущем")
+    if day < today - _MAX_PAST_DAYS:
+        raise ValueError(f"Дата не может быть более чем на {_MAX_PAST_YEARS} лет в прошлом")
+    return v
+
+
+def _validate_record_date(v: str) -> str:
+    """Validate a health record date (at most one day in the future)."""
+    return _check_date_bounds(v, 1)
+
 
-    max_past = now - timedelta(days=max_past_years * 365)
-    if dt < max_past:
-        raise ValueError(f"Дата не может быть более чем на {max_past_years} лет в прошлом")
+def _validate_birth_date(v: str) -> str:
+    """Validate a birth date (no future dates)."""
+    return _check_date_bounds(v, 0)
 
+
+def _validate_time(v: str) -> str:
+    """Validate HH:MM time format (same inputs as strptime "%H:%M") with integer checks only."""
+    if not v:
+        return v
+    hours, sep, minutes = v.partition(":")
+    if not (
+        sep
+        and 1 <= len(hours) <= 2
+        and 1 <= len(minutes) <= 2
+        and hours.isascii()
+        and minutes.isascii()
+        and hours.isdigit()
+        and minutes.isdigit()
+        and int(hours) < 24
+        and int(minutes) < 60
+    ):
+        raise ValueError("Неверный формат времени. Используйте HH:MM")
     return v
 
 
+def _blank_to_none(v: Any) -> Any:
+    """Treat an empty select value as "not chosen" so the route applies its default."""
+    return None if v == "" else v
+
+
+# Shared date/time string types (one validator definition reused by all schemas)
+DateStr = Annotated[str, AfterValidator(_validate_record_date)]
+BirthDateStr = Annotated[str, AfterValidator(_validate_birth_date)]
+TimeStr = Annotated[str, AfterValidator(_validate_time)]
+
+# Shared account field constraints
+Username = Annotated[str, StringConstraints(min_length=1, max_length=50)]
+Password = Annotated[str, StringConstraints(min_length=6, max_length=100)]
+
+# Fixed choices offered by the dashboard record forms (static/js/forms-config.js); "" is accepted as unset
+DropsType = Annotated[Optional[Literal["Обычные", "Гелевые"]], BeforeValidator(_blank_to_none)]
+BrushingType = Annotated[Optional[Literal["Щетка", "Марля", "Игрушка"]], BeforeValidator(_blank_to_none)]
+EarCleaningType = Annotated[Optional[Literal["Салфетка/Марля", "Капли"]], BeforeValidator(_blank_to_none)]
+
+
 # ============================================================================
 # Common Response Models
 # ============================================================================
@@ -93,7 +172,7 @@ class PaginatedResponse(BaseModel):
 class AuthLoginRequest(BaseModel):
     """Login request model."""
 
-    username: str = Field(..., min_length=1, max_length=50, description="Имя пользователя")
+    username: Username = Field(..., description="Имя пользователя")
     password: str = Field(..., min_length=1, description="Пароль")
 
     model_config = ConfigDict(
@@ -147,6 +226,7 @@ class AuthRefreshResponse(BaseModel):
     access_token: str
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "success": True,
@@ -162,6 +242,7 @@ class AdminStatusResponse(BaseModel):
     is_admin: bool
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "is_admin": True,
@@ -186,8 +267,8 @@ class UserSearchResponse(BaseModel):
 class UserCreate(BaseModel):
     """User creation request model."""
 
-    username: str = Field(..., min_length=1, max_length=50, description="Имя пользователя")
-    password: str = Field(..., min_length=6, max_length=100, description="Пароль")
+    username: Username = Field(..., description="Имя пользователя")
+    password: Password = Field(..., description="Пароль")
     full_name: Optional[str] = Field(None, max_length=100, description="Полное имя")
     email: Optional[str] = Field(None, max_length=100, description="Email")
 
@@ -203,13 +284,37 @@ class UserCreate(BaseModel):
     )
 
 
+class UserBulkCreate(BaseModel):
+    """Bulk user creation request model."""
+
+    # Each row costs one Argon2id hash (~0.1 s of CPU); 50 rows stay well inside the 30 s gunicorn worker timeout
+    users: List[UserCreate] = Field(..., min_length=1, max_length=50, description="Пользователи для создания")
+
+
+class UserBulkCreateResult(BaseModel):
+    """Outcome of creating one user in a bulk request."""
+
+    username: str
+    created: bool
+    code: Optional[str] = None
+    error: Optional[str] = None
+
+
+class UserBulkCreateResponse(BaseModel):
+    """Bulk user creation response with per-user results in request order."""
+
+    success: bool = True
+    message: str
+    results: List[UserBulkCreateResult]
+
+
 class UserUpdate(BaseModel):
     """User update request model."""
 
     full_name: Optional[str] = Field(None, max_length=100)
     email: Optional[str] = Field(None, max_length=100)
     is_active: Optional[bool] = None
-    password: Optional[str] = Field(None, min_length=6, max_length=100, description="Новый пароль (опционально)")
+    password: Optional[Password] = Field(None, description="Новый пароль (опционально)")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -265,7 +370,7 @@ class UserListResponse(BaseModel):
 class UserPasswordResetRequest(BaseModel):
     """User password reset request model."""
 
-    password: str = Field(..., min_length=6, max_length=100, description="Новый пароль")
+    password: Password = Field(..., description="Новый пароль")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -312,19 +417,13 @@ class PetCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=100, description="Имя питомца")
     breed: Optional[str] = Field(None, max_length=100, description="Порода")
     species: Optional[str] = Field(None, max_length=50, description="Вид животного (кот, собака и т.д.)")
-    birth_date: Optional[str] = Field(None, description="Дата рождения в формате YYYY-MM-DD")
+    birth_date: Optional[BirthDateStr] = Field(None, description="Дата рождения в формате YYYY-MM-DD")
     gender: Optional[str] = Field(None, max_length=20, description="Пол")
     is_neutered: Optional[bool] = Field(None, description="Кастрирован/Стерилизована")
     health_notes: Optional[str] = Field(None, max_length=1000, description="Особенности здоровья, аллергии")
     photo_url: Optional[str] = Field(None, description="URL фотографии")
     tiles_settings: Optional[TilesSettings] = Field(None, description="Настройки тайлов дневника")
 
-    @field_validator("birth_date")
-    @classmethod
-    def validate_birth_date(cls, v):
-        """Validate birth date format and logic (no future dates)."""
-        return validate_date_logic(v, allow_future=False)
-
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -360,7 +459,7 @@ class PetUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     breed: Optional[str] = Field(None, max_length=100)
     species: Optional[str] = Field(None, max_length=50)
-    birth_date: Optional[str] = Field(None, description="Дата рождения в формате YYYY-MM-DD")
+    birth_date: Optional[BirthDateStr] = Field(None, description="Дата рождения в формате YYYY-MM-DD")
     gender: Optional[str] = Field(None, max_length=20)
     is_neutered: Optional[bool] = None
     health_notes: Optional[str] = Field(None, max_length=1000)
@@ -368,12 +467,6 @@ class PetUpdate(BaseModel):
     remove_photo: Optional[bool] = Field(None, description="True, если нужно удалить текущую фотографию")
     tiles_settings: Optional[TilesSettings] = Field(None, description="Настройки тайлов дневника")
 
-    @field_validator("birth_date")
-    @classmethod
-    def validate_birth_date(cls, v):
-        """Validate birth date format and logic (no future dates)."""
-        return validate_date_logic(v, allow_future=False)
-
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -476,9 +569,10 @@ class PetListResponse(BaseModel):
 class PetShareRequest(BaseModel):
     """Pet sharing request model."""
 
-    username: str = Field(..., min_length=1, max_length=50, description="Имя пользователя для предоставления доступа")
+    username: Username = Field(..., description="Имя пользователя для предоставления доступа")
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "username": "user1",
@@ -512,55 +606,29 @@ class HealthRecordBase(BaseModel):
     """Base schema for health records."""
 
     pet_id: ObjectIdString = Field(..., description="ID питомца")
-    date: str = Field(..., description="Дата в формате YYYY-MM-DD")
-    time: str = Field(..., description="Время в формате HH:MM")
+    date: DateStr = Field(..., description="Дата в формате YYYY-MM-DD")
+    time: TimeStr = Field(..., description="Время в формате HH:MM")
     comment: Optional[str] = Field(None, max_length=500, description="Комментарий")
 
-    @field_validator("date")
-    @classmethod
-    def validate_date(cls, v):
-        """Validate date format and logic."""
-        return validate_date_logic(v, allow_future=True, max_future_days=1)
-
-    @field_validator("time")
-    @classmethod
-    def validate_time(cls, v):
-        """Validate time format."""
-        if not v:
-            return v
-        try:
-            datetime.strptime(v, "%H:%M")
-        except ValueError:
-            raise ValueError("Неверный формат времени. Используйте HH:MM")
-        return v
-
 
 class HealthRecordUpdateBase(BaseModel):
     """Base schema for health record updates."""
 
-    date: Optional[str] = Field(None, description="Дата в формате YYYY-MM-DD")
-    time: Optional[str] = Field(None, description="Время в формате HH:MM")
+    date: Optional[DateStr] = Field(None, description="Дата в формате YYYY-MM-DD")
+    time: Optional[TimeStr] = Field(None, description="Время в формате HH:MM")
     comment: Optional[str] = Field(None, max_length=500, description="Комментарий")
 
-    @field_validator("date")
-    @classmethod
-    def validate_date(cls, v):
-        """Validate date format and logic."""
-        if v:
-            return validate_date_logic(v, allow_future=True, max_future_days=1)
-        return v
 
-    @field_validator("time")
-    @classmethod
-    def validate_time(cls, v):
-        """Validate time format."""
-        if not v:
-            return v
-        try:
-            datetime.strptime(v, "%H:%M")
-        except ValueError:
-            raise ValueError("Неверный формат времени. Используйте HH:MM")
-        return v
+class HealthItemBase(BaseModel):
+    """Base schema for health record items in list responses."""
+
+    _id: str
+    pet_id: str
+    date_time: str
+    username: str
+    comment: Optional[str] = None
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 
 # ============================================================================
@@ -611,17 +679,12 @@ class AsthmaAttackUpdate(HealthRecordUpdateBase):
     )
 
 
-class AsthmaAttackItem(BaseModel):
+class AsthmaAttackItem(HealthItemBase):
     """Asthma attack item in list response."""
 
-    _id: str
-    pet_id: str
-    date_time: str
-    username: str
     duration: Optional[str] = None
     reason: Optional[str] = None
     inhalation: Optional[bool] = None  # Boolean value (true/false) as stored in DB
-    comment: Optional[str] = None
 
 
 class AsthmaAttackListResponse(PaginatedResponse):
@@ -678,17 +741,12 @@ class DefecationUpdate(HealthRecordUpdateBase):
     )
 
 
-class DefecationItem(BaseModel):
+class DefecationItem(HealthItemBase):
     """Defecation item in list response."""
 
-    _id: str
-    pet_id: str
-    date_time: str
-    username: str
     stool_type: Optional[str] = None
     color: Optional[str] = None
     food: Optional[str] = None
-    comment: Optional[str] = None
 
 
 class DefecationListResponse(PaginatedResponse):
@@ -731,15 +789,9 @@ class LitterChangeUpdate(HealthRecordUpdateBase):
     )
 
 
-class LitterChangeItem(BaseModel):
+class LitterChangeItem(HealthItemBase):
     """Litter change item in list response."""
 
-    _id: str
-    pet_id: str
-    date_time: str
-    username: str
-    comment: Optional[str] = None
-
 
 class LitterChangeListResponse(PaginatedResponse):
     """List of litter changes response with pagination."""
@@ -791,16 +843,11 @@ class WeightRecordUpdate(HealthRecordUpdateBase):
     )
 
 
-class WeightRecordItem(BaseModel):
+class WeightRecordItem(HealthItemBase):
     """Weight record item in list response."""
 
-    _id: str
-    pet_id: str
-    date_time: str
-    username: str
     weight: Optional[float] = None
     food: Optional[str] = None
-    comment: Optional[str] = None
 
 
 class WeightRecordListResponse(PaginatedResponse):
@@ -849,15 +896,10 @@ class FeedingUpdate(HealthRecordUpdateBase):
     )
 
 
-class FeedingItem(BaseModel):
+class FeedingItem(HealthItemBase):
     """Feeding item in list response."""
 
-    _id: str
-    pet_id: str
-    date_time: str
-    username: str
     food_weight: Optional[float] = None
-    comment: Optional[str] = None
 
 
 class FeedingListResponse(PaginatedResponse):
@@ -874,7 +916,7 @@ class FeedingListResponse(PaginatedResponse):
 class EyeDropsCreate(HealthRecordBase):
     """Eye drops creation request model."""
 
-    drops_type: Optional[str] = Field(None, max_length=50, description="Тип капель")
+    drops_type: DropsType = Field(None, description="Тип капель")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -892,7 +934,7 @@ class EyeDropsCreate(HealthRecordBase):
 class EyeDropsUpdate(HealthRecordUpdateBase):
     """Eye drops update request model."""
 
-    drops_type: Optional[str] = Field(None, max_length=50)
+    drops_type: DropsType = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -906,15 +948,10 @@ class EyeDropsUpdate(HealthRecordUpdateBase):
     )
 
 
-class EyeDropsItem(BaseModel):
+class EyeDropsItem(HealthItemBase):
     """Eye drops item in list response."""
 
-    _id: str
-    pet_id: str
-    date_time: str
-    username: str
     drops_type: Optional[str] = None
-    comment: Optional[str] = None
 
 
 class EyeDropsListResponse(PaginatedResponse):
@@ -931,7 +968,7 @@ class EyeDropsListResponse(PaginatedResponse):
 class ToothBrushingCreate(HealthRecordBase):
     """Tooth brushing creation request model."""
 
-    brushing_type: Optional[str] = Field(None, max_length=50, description="Способ чистки")
+    brushing_type: BrushingType = Field(None, description="Способ чистки")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -949,7 +986,7 @@ class ToothBrushingCreate(HealthRecordBase):
 class ToothBrushingUpdate(HealthRecordUpdateBase):
     """Tooth brushing update request model."""
 
-    brushing_type: Optional[str] = Field(None, max_length=50)
+    brushing_type: BrushingType = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -963,15 +1000,10 @@ class ToothBrushingUpdate(HealthRecordUpdateBase):
     )
 
 
-class ToothBrushingItem(BaseModel):
+class ToothBrushingItem(HealthItemBase):
     """Tooth brushing item in list response."""
 
-    _id: str
-    pet_id: str
-    date_time: str
-    username: str
     brushing_type: Optional[str] = None
-    comment: Optional[str] = None
 
 
 class ToothBrushingListResponse(PaginatedResponse):
@@ -987,7 +1019,7 @@ class ToothBrushingListResponse(PaginatedResponse):
 class EarCleaningCreate(HealthRecordBase):
     """Ear cleaning creation request model."""
 
-    cleaning_type: Optional[str] = Field(None, max_length=50, description="Способ чистки")
+    cleaning_type: EarCleaningType = Field(None, description="Способ чистки")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -1005,7 +1037,7 @@ class EarCleaningCreate(HealthRecordBase):
 class EarCleaningUpdate(HealthRecordUpdateBase):
     """Ear cleaning update request model."""
 
-    cleaning_type: Optional[str] = Field(None, max_length=50)
+    cleaning_type: EarCleaningType = None
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -1019,15 +1051,10 @@ class EarCleaningUpdate(HealthRecordUpdateBase):
     )
 
 
-class EarCleaningItem(BaseModel):
+class EarCleaningItem(HealthItemBase):
     """Ear cleaning item in list response."""
 
-    _id: str
-    pet_id: str
-    date_time: str
-    username: str
     cleaning_type: Optional[str] = None
-    comment: Optional[str] = None
 
 
 class EarCleaningListResponse(PaginatedResponse):
@@ -5,13 +5,25 @@ It exposes JWT helpers, auth helpers and access decorators which are re-exported
 from `web.app` and imported directly from blueprints.
 """
 
+import base64
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from functools import wraps
+import hashlib
+import hmac
 import logging
+import os
+import threading
+import time
 
 import bcrypt
 import jwt
-from flask import request
+import orjson
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError
+from cachetools import TLRUCache, TTLCache
+from flask import g, request
+from pymongo.errors import PyMongoError
 
 from web.configs import JWT_CONFIG, ADMIN_CONFIG
 from web.db import db
@@ -25,6 +37,8 @@ JWT_SECRET_KEY = JWT_CONFIG["secret_key"]
 JWT_ALGORITHM = JWT_CONFIG["algorithm"]
 ACCESS_TOKEN_EXPIRE_MINUTES = JWT_CONFIG["access_token_expire_minutes"]
 REFRESH_TOKEN_EXPIRE_DAYS = JWT_CONFIG["refresh_token_expire_days"]
+# Minimum interval between refresh token `last_used_at` writes
+REFRESH_TOKEN_TOUCH_INTERVAL = timedelta(minutes=1)
 
 # Authentication credentials - REQUIRED from environment
 ADMIN_USERNAME = ADMIN_CONFIG["username"]
@@ -34,10 +48,101 @@ ADMIN_PASSWORD_HASH = ADMIN_CONFIG["password_hash"]
 if not ADMIN_PASSWORD_HASH:
     raise RuntimeError(
         "ADMIN_PASSWORD_HASH environment variable is required! "
-        'To generate hash: python -c "import bcrypt; '
-        "print(bcrypt.hashpw('your_password'.encode(), bcrypt.gensalt()).decode())\""
+        'To generate hash: python -c "from argon2 import PasswordHasher; '
+        "print(PasswordHasher().hash('your_password'))\""
     )
 
+# Encoded once for the admin fallback in verify_user_credentials
+ADMIN_USERNAME_BYTES = ADMIN_USERNAME.encode()
+ADMIN_PASSWORD_HASH_BYTES = ADMIN_PASSWORD_HASH.encode()
+
+# Argon2id for new password hashes. Stored as self-describing PHC strings, so raising the
+# cost later only needs check_needs_rehash() on login. Legacy bcrypt hashes stay valid.
+PASSWORD_HASHER = PasswordHasher(
+    time_cost=ADMIN_CONFIG["argon2_time_cost"],
+    memory_cost=ADMIN_CONFIG["argon2_memory_cost"],
+    parallelism=1,
+)
+_BCRYPT_PREFIXES = (b"$2a$", b"$2b$", b"$2y$")
+
+# Pool for password hashing: argon2 and bcrypt release the GIL, so callers can overlap DB I/O
+# with a hash and bulk requests can hash several passwords on separate cores.
+PASSWORD_HASH_POOL = ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, 8), thread_name_prefix="pwhash")
+PASSWORD_HASH_TIMEOUT = 5
+
+
+def hash_password(password):
+    """Hash `password` with Argon2id; returns the PHC-format string stored in `password_hash`."""
+    return PASSWORD_HASHER.hash(password)
+
+
+def submit_password_hash(password):
+    """Start hashing `password` on PASSWORD_HASH_POOL; returns a future resolving to the str hash."""
+    return PASSWORD_HASH_POOL.submit(hash_password, password)
+
+
+def _is_legacy_hash(hash_bytes):
+    return hash_bytes.startswith(_BCRYPT_PREFIXES)
+
+
+def password_needs_rehash(password_hash):
+    """True for legacy bcrypt hashes and Argon2 hashes made with outdated parameters."""
+    hash_bytes = password_hash if isinstance(password_hash, bytes) else password_hash.encode()
+    return _is_legacy_hash(hash_bytes) or PASSWORD_HASHER.check_needs_rehash(hash_bytes)
+
+
+# Per-process secret for cache keys, so keys cannot be predicted or collided from outside
+_CACHE_KEY_SECRET = os.urandom(32)
+
+
+def _cache_key(*parts):
+    """16-byte keyed BLAKE2b digest of `parts` (bytes), used instead of raw secrets as cache keys."""
+    return hashlib.blake2b(b"\0".join(parts), digest_size=16, key=_CACHE_KEY_SECRET).digest()
+
+
+# Short-lived cache of successful password checks. Keys are digests over username, stored
+# hash and password, so no raw password is kept and a password change (new hash)
+# invalidates old entries. Failures are never cached.
+_VERIFIED_CREDENTIALS = TTLCache(maxsize=4096, ttl=60)
+_verified_credentials_lock = threading.Lock()
+
+
+def _check_password(username, password, password_hash):
+    """Verify an Argon2 or legacy bcrypt hash, with a cache of recent successful verifications.
+
+    `password_hash` may be given as str (as stored in MongoDB) or already-encoded bytes.
+    """
+    password_bytes = password.encode()
+    hash_bytes = password_hash if isinstance(password_hash, bytes) else password_hash.encode()
+    key = _cache_key(username.encode(), hash_bytes, password_bytes)
+    with _verified_credentials_lock:
+        if key in _VERIFIED_CREDENTIALS:
+            return True
+
+    if _is_legacy_hash(hash_bytes):
+        if not bcrypt.checkpw(password_bytes, hash_bytes):
+            return False
+    else:
+        try:
+            PASSWORD_HASHER.verify(hash_bytes, password_bytes)
+        except VerificationError:
+            return False
+
+    with _verified_credentials_lock:
+        _VERIFIED_CREDENTIALS[key] = True
+    return True
+
+
+def _rehash_user_password(user, password):
+    """Replace a legacy or outdated stored hash after a successful login."""
+    try:
+        db["users"].update_one(
+            {"_id": user["_id"], "password_hash": user["password_hash"]},
+            {"$set": {"password_hash": hash_password(password)}},
+        )
+    except PyMongoError as e:
+        logger.warning(f"Failed to upgrade password hash: username={user.get('username')}, error={e}")
+
 
 def verify_user_credentials(username, password):
     """Verify user credentials from database or fallback to admin."""
@@ -45,13 +150,20 @@ def verify_user_credentials(username, password):
     user = db["users"].find_one({"username": username, "is_active": True})
     if user:
         try:
-            return bcrypt.checkpw(password.encode(), user["password_hash"].encode())
+            if not _check_password(username, password, user["password_hash"]):
+                return False
+            if password_needs_rehash(user["password_hash"]):
+                _rehash_user_password(user, password)
+            return True
         except (ValueError, TypeError, KeyError):
             return False
 
     # Fallback to admin credentials for backward compatibility
     try:
-        return username == ADMIN_USERNAME and bcrypt.checkpw(password.encode(), ADMIN_PASSWORD_HASH.encode())
+        # Constant-time comparison so response timing does not reveal the admin username
+        return hmac.compare_digest(username.encode(), ADMIN_USERNAME_BYTES) and _check_password(
+            username, password, ADMIN_PASSWORD_HASH_BYTES
+        )
     except (ValueError, TypeError):
         return False
 
@@ -77,49 +189,106 @@ def ensure_default_admin():
         db["users"].update_one({"username": ADMIN_USERNAME}, {"$set": {"is_admin": True}})
 
 
+def ensure_indexes():
+    """Create indexes used on the authentication and user management paths (idempotent)."""
+    indexes = (
+        # Not unique: two logins of the same user within one second produce identical tokens
+        ("refresh_tokens", "token", {}),
+        ("users", "username", {"unique": True}),
+        # Serves the newest-first sort of the admin user list
+        ("users", [("created_at", -1)], {}),
+    )
+    for collection, keys, options in indexes:
+        try:
+            db[collection].create_index(keys, **options)
+        except PyMongoError as e:
+            logger.warning(f"Could not create {collection} index on {keys}: {e}")
+
+
+def _b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# HS256 tokens are signed directly; the header never changes, so it is encoded once.
+# The result is a valid HS256 JWT equivalent to jwt.encode(); orjson keeps non-ASCII characters
+# as raw UTF-8 where PyJWT escapes them, so the bytes can differ but the claims are the same.
+_JWT_HEADER_B64 = _b64url(orjson.dumps({"alg": JWT_ALGORITHM, "typ": "JWT"}))
+_JWT_SIGNING_KEY = JWT_SECRET_KEY.encode()
+
+
+def _encode_token(payload):
+    """Encode a JWT whose `exp` claim is already an integer timestamp."""
+    if JWT_ALGORITHM != "HS256":
+        return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(orjson.dumps(payload))
+    signature = hmac.new(_JWT_SIGNING_KEY, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
+
+
 def create_access_token(username):
     """Create JWT access token."""
-    expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    payload = {"username": username, "exp": expire, "type": "access"}
-    return jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    now = int(time.time())
+    payload = {"username": username, "exp": now + ACCESS_TOKEN_EXPIRE_MINUTES * 60, "iat": now, "type": "access"}
+    return _encode_token(payload)
 
 
 def create_refresh_token(username):
     """Create JWT refresh token and store it in database."""
-    expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    payload = {"username": username, "exp": expire, "type": "refresh"}
-    token = jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    now = int(time.time())
+    exp = now + REFRESH_TOKEN_EXPIRE_DAYS * 86400
+    payload = {"username": username, "exp": exp, "iat": now, "type": "refresh"}
+    token = _encode_token(payload)
 
     db["refresh_tokens"].insert_one(
         {
             "token": token,
             "username": username,
-            "created_at": datetime.now(timezone.utc),
-            "expires_at": expire,
+            "created_at": datetime.fromtimestamp(now, timezone.utc),
+            "expires_at": datetime.fromtimestamp(exp, timezone.utc),
         }
     )
 
     return token
 
 
+def _token_ttu(_key, payload, now):
+    """Expire a cached token at its own `exp` claim, but keep it at most 60 seconds."""
+    return now + min(payload["exp"] - time.time(), 60)
+
+
+# Successfully decoded tokens keyed by a digest of (token_type, token); invalid tokens are never cached
+_VERIFIED_TOKENS = TLRUCache(maxsize=10000, ttu=_token_ttu)
+_verified_tokens_lock = threading.Lock()
+
+
 def verify_token(token, token_type="access"):
     """Verify JWT token and return payload."""
+    key = _cache_key(token_type.encode(), token.encode())
+    with _verified_tokens_lock:
+        payload = _VERIFIED_TOKENS.get(key)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
         if payload.get("type") != token_type:
             return None
-        return payload
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
         return None
 
+    if "exp" in payload:
+        with _verified_tokens_lock:
+            _VERIFIED_TOKENS[key] = payload
+    return payload
+
 
 def get_token_from_request():
     """Extract token from Authorization header or cookie."""
-    # Try Authorization header first
-    auth_header = request.headers.get("Authorization", "")
-    if auth_header.startswith("Bearer "):
+    # Try Authorization header first (read from the WSGI environ, skipping EnvironHeaders lookup)
+    auth_header = request.environ.get("HTTP_AUTHORIZATION")
+    if auth_header is not None and auth_header[:7] == "Bearer ":
         return auth_header[7:]
 
     # Try cookie
@@ -138,7 +307,7 @@ def try_refresh_access_token():
         return None
 
     # Check if token exists in database
-    token_record = db["refresh_tokens"].find_one({"token": refresh_token})
+    token_record = db["refresh_tokens"].find_one({"token": refresh_token}, {"last_used_at": 1})
     if not token_record:
         return None
 
@@ -147,11 +316,13 @@ def try_refresh_access_token():
     # Create new access token
     access_token = create_access_token(username or "")
 
-    # Update token in database (optional, for tracking)
-    db["refresh_tokens"].update_one(
-        {"token": refresh_token},
-        {"$set": {"last_used_at": datetime.now(timezone.utc)}},
-    )
+    # Update token in database (optional, for tracking); skip the write if it was touched recently
+    now = datetime.now(timezone.utc)
+    last_used_at = token_record.get("last_used_at")
+    if last_used_at is not None and last_used_at.tzinfo is None:
+        last_used_at = last_used_at.replace(tzinfo=timezone.utc)  # pymongo returns naive UTC datetimes
+    if last_used_at is None or now - last_used_at >= REFRESH_TOKEN_TOUCH_INTERVAL:
+        db["refresh_tokens"].update_one({"_id": token_record["_id"]}, {"$set": {"last_used_at": now}})
 
     return access_token
 
@@ -171,7 +342,7 @@ def get_current_user():
 
 
 def is_admin(username):
-    """Check if user is admin."""
+    """Check if user is admin (only the configured ADMIN_USERNAME; the is_admin DB flag is not trusted)."""
     return username == ADMIN_USERNAME
 
 
@@ -180,7 +351,9 @@ def login_required(f):
 
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        from flask import g  # imported lazily to avoid hard dependency at import time
+        # Already authenticated by an outer login_required in this request (nested decorators)
+        if getattr(request, "_auth_ok", False) and getattr(request, "current_user", None):
+            return f(*args, **kwargs)
 
         token = get_token_from_request()
         payload = None
@@ -203,6 +376,7 @@ def login_required(f):
         # Store username in request context
         username = payload.get("username")
         setattr(request, "current_user", username)
+        setattr(request, "_auth_ok", True)
         g.current_user = username  # optional, for Flask context
 
         response = f(*args, **kwargs)
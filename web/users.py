@@ -1,18 +1,24 @@
 """Admin-only user management routes."""
 
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
 
-import bcrypt
 from flask import Blueprint, jsonify, request
 from flask_pydantic_spec import Request, Response
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError
 
 from web.app import api, logger  # shared logger and api
+from web.configs import API_CONFIG
 from web.security import login_required, admin_required
 import web.app as app  # to access patched app.db in tests
-from web.security import ADMIN_USERNAME
+from web.security import ADMIN_USERNAME, PASSWORD_HASH_TIMEOUT, hash_password, submit_password_hash
 from web.messages import get_message
 from web.schemas import (
     UserCreate,
+    UserBulkCreate,
+    UserBulkCreateResponse,
     UserUpdate,
     UserResponseWrapper,
     UserListResponse,
@@ -21,25 +27,42 @@ from web.schemas import (
     SuccessResponse,
     ErrorResponse,
 )
-from web.errors import error_response
+from web.errors import ERRORS, error_response
+
+# Total time a bulk request may spend waiting for password hashes, kept below the gunicorn worker timeout
+BULK_PASSWORD_HASH_TIMEOUT = 20
 
 
 users_bp = Blueprint("users", __name__)
 
+# Fields returned by the admin user list (everything except password_hash)
+_USER_LIST_PROJECTION = {
+    "username": 1,
+    "full_name": 1,
+    "email": 1,
+    "created_at": 1,
+    "created_by": 1,
+    "is_active": 1,
+    "is_admin": 1,
+}
+
+
+def _format_user(user):
+    """Convert a user document for JSON output: stringify _id and format created_at."""
+    user["_id"] = str(user["_id"])
+    if isinstance(user.get("created_at"), datetime):
+        user["created_at"] = user["created_at"].strftime("%Y-%m-%d %H:%M")
+    return user
+
 
 @users_bp.route("/api/users", methods=["GET"])
 @login_required
 @admin_required
-@api.validate(resp=Response(HTTP_200=UserListResponse), tags=["users"])
+@api.validate(resp=Response(HTTP_200=UserListResponse, validate=API_CONFIG["validate_responses"]), tags=["users"])
 def get_users():
     """Get list of all users (admin only)."""
-    users = list(app.db["users"].find({}).sort("created_at", -1))
-
-    for user in users:
-        user["_id"] = str(user["_id"])
-        user.pop("password_hash", None)
-        if isinstance(user.get("created_at"), datetime):
-            user["created_at"] = user["created_at"].strftime("%Y-%m-%d %H:%M")
+    cursor = app.db["users"].find({}, _USER_LIST_PROJECTION).sort("created_at", -1).batch_size(500)
+    users = [_format_user(user) for user in cursor]
 
     return jsonify({"users": users})
 
@@ -78,13 +101,15 @@ def create_user():
         # `context` is injected by flask-pydantic-spec at runtime; static type checker doesn't know this attribute.
         data = request.context.body  # type: ignore[attr-defined]
         username = data.username
-        password = data.password
+        # Hash on the password pool while the duplicate check hits the database
+        hash_future = submit_password_hash(data.password)
 
-        existing = app.db["users"].find_one({"username": username})
+        existing = app.db["users"].find_one({"username": username}, {"_id": 1})
         if existing:
+            hash_future.cancel()
             return error_response("user_exists")
 
-        password_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+        password_hash = hash_future.result(timeout=PASSWORD_HASH_TIMEOUT)
 
         current_user = getattr(request, "current_user", "admin")
 
@@ -107,31 +132,107 @@ def create_user():
         logger.info(f"User created: username={user_data['username']}, created_by={current_user}")
         return get_message("user_created", status=201, user=user_data)
 
+    except FutureTimeoutError:
+        hash_future.cancel()
+        logger.warning(f"Password hashing timed out for user creation: username={data.username}")
+        return error_response("internal_error")
     except ValueError as e:
         current_user = getattr(request, "current_user", "admin")
         logger.warning(f"Invalid input data for user creation: user={current_user}, error={e}")
         return error_response("validation_error", str(e))
 
 
+@users_bp.route("/api/users/bulk", methods=["POST"])
+@login_required
+@admin_required
+@api.validate(
+    body=Request(UserBulkCreate),
+    resp=Response(HTTP_201=UserBulkCreateResponse, HTTP_422=ErrorResponse, HTTP_500=ErrorResponse),
+    tags=["users"],
+)
+def create_users_bulk():
+    """Create several users in one request (admin only).
+
+    Passwords are hashed in parallel on the password pool and all new users are written
+    with a single unordered bulk_write. Existing or repeated usernames are reported per row,
+    as are rows whose hash did not finish within BULK_PASSWORD_HASH_TIMEOUT.
+    """
+    data = request.context.body  # type: ignore[attr-defined]
+    current_user = getattr(request, "current_user", "admin")
+    user_exists = ERRORS["user_exists"]
+    internal_error = ERRORS["internal_error"]
+
+    usernames = [user.username for user in data.users]
+    taken = {u["username"] for u in app.db["users"].find({"username": {"$in": usernames}}, {"username": 1})}
+
+    results = []
+    pending = []  # (result index, request item, hash future)
+    for user in data.users:
+        if user.username in taken:
+            results.append(
+                {"username": user.username, "created": False, "code": user_exists.code, "error": user_exists.message}
+            )
+            continue
+        taken.add(user.username)
+        pending.append((len(results), user, submit_password_hash(user.password)))
+        results.append({"username": user.username, "created": True})
+
+    docs = []
+    inserted = []  # pending entries that made it into docs, aligned with bulk_write indexes
+    created_at = datetime.now(timezone.utc)
+    deadline = time.monotonic() + BULK_PASSWORD_HASH_TIMEOUT
+    for entry in pending:
+        index, user, hash_future = entry
+        try:
+            password_hash = hash_future.result(timeout=max(0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            hash_future.cancel()
+            results[index].update(created=False, code=internal_error.code, error=internal_error.message)
+            continue
+        inserted.append(entry)
+        docs.append(
+            {
+                "username": user.username,
+                "password_hash": password_hash,
+                "full_name": user.full_name or "",
+                "email": user.email or "",
+                "created_at": created_at,
+                "created_by": current_user,
+                "is_active": True,
+            }
+        )
+
+    if docs:
+        try:
+            app.db["users"].bulk_write([InsertOne(doc) for doc in docs], ordered=False)
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            if any(write_error.get("code") != 11000 for write_error in write_errors):
+                raise
+            # Rows rejected by the unique username index (created concurrently by another request)
+            for write_error in write_errors:
+                result = results[inserted[write_error["index"]][0]]
+                result.update(created=False, code=user_exists.code, error=user_exists.message)
+
+    created = sum(1 for result in results if result["created"])
+    logger.info(f"Users bulk created: created={created}, requested={len(results)}, created_by={current_user}")
+    return get_message("users_bulk_created", status=201, created=created, results=results)
+
+
 @users_bp.route("/api/users/<username>", methods=["GET"])
 @login_required
 @admin_required
 @api.validate(
-    resp=Response(HTTP_200=UserResponseWrapper, HTTP_404=ErrorResponse),
+    resp=Response(HTTP_200=UserResponseWrapper, HTTP_404=ErrorResponse, validate=API_CONFIG["validate_responses"]),
     tags=["users"],
 )
 def get_user(username):
     """Get user information (admin only)."""
-    user = app.db["users"].find_one({"username": username})
+    user = app.db["users"].find_one({"username": username}, {"password_hash": 0})
     if not user:
         return error_response("user_not_found")
 
-    user["_id"] = str(user["_id"])
-    user.pop("password_hash", None)
-    if isinstance(user.get("created_at"), datetime):
-        user["created_at"] = user["created_at"].strftime("%Y-%m-%d %H:%M")
-
-    return jsonify({"user": user})
+    return jsonify({"user": _format_user(user)})
 
 
 @users_bp.route("/api/users/<username>", methods=["PUT"])
@@ -145,7 +246,7 @@ def get_user(username):
 def update_user(username):
     """Update user information (admin only)."""
     try:
-        user = app.db["users"].find_one({"username": username})
+        user = app.db["users"].find_one({"username": username}, {"_id": 1})
         if not user:
             return error_response("user_not_found")
 
@@ -161,8 +262,7 @@ def update_user(username):
             update_data["is_active"] = data.is_active
         if data.password is not None:
             # Hash the new password
-            password_hash = bcrypt.hashpw(data.password.encode(), bcrypt.gensalt()).decode()
-            update_data["password_hash"] = password_hash
+            update_data["password_hash"] = hash_password(data.password)
 
         if not update_data:
             return error_response("validation_error_no_update_data")
@@ -222,13 +322,14 @@ def reset_user_password(username):
     """Reset user password (admin only)."""
     try:
         data = request.context.body  # type: ignore[attr-defined]
-        new_password = data.password
+        hash_future = submit_password_hash(data.password)
 
-        user = app.db["users"].find_one({"username": username})
+        user = app.db["users"].find_one({"username": username}, {"_id": 1})
         if not user:
+            hash_future.cancel()
             return error_response("user_not_found")
 
-        password_hash = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt()).decode()
+        password_hash = hash_future.result(timeout=PASSWORD_HASH_TIMEOUT)
 
         result = app.db["users"].update_one({"username": username}, {"$set": {"password_hash": password_hash}})
 
@@ -238,6 +339,10 @@ def reset_user_password(username):
         logger.info(f"Password reset: username={username}, reset_by={getattr(request, 'current_user', 'admin')}")
         return get_message("user_password_reset")
 
+    except FutureTimeoutError:
+        hash_future.cancel()
+        logger.warning(f"Password hashing timed out for password reset: username={username}")
+        return error_response("internal_error")
     except ValueError as e:
         current_user = getattr(request, "current_user", "admin")
         logger.warning(f"Invalid input data for password reset: username={username}, user={current_user}, error={e}")